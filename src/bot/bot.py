@@ -7,8 +7,11 @@ import discord
 from discord.ext import commands
 
 from src.bot.changelog import check_and_send_changelog
+from src.utils.config import BrazilTimeFormatter, clear_log_handlers, queue_log_handlers
 
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+COMMAND_LOG_FORMAT = '[%(asctime)s] %(message)s'
+COMMAND_LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 def setup_logging():
     """Configura o sistema de logging com saída para console e arquivo."""
@@ -21,21 +24,19 @@ def setup_logging():
     logger = logging.getLogger('team_analysis_bot')
     logger.setLevel(logging.DEBUG)
 
-    if logger.handlers:
-        logger.handlers.clear()
+    clear_log_handlers(logger)
 
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    console_handler.setFormatter(BrazilTimeFormatter(LOG_FORMAT))
     console_handler.setLevel(logging.DEBUG)
-    logger.addHandler(console_handler)
 
     file_handler = RotatingFileHandler(
         log_file,
         maxBytes=10*1024*1024,
         backupCount=5
     )
-    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(BrazilTimeFormatter(LOG_FORMAT))
+    logger.addHandler(queue_log_handlers(console_handler, file_handler))
 
     cmd_log_file = os.path.join(log_dir, f'commands_{today}.log')
     cmd_handler = RotatingFileHandler(
@@ -43,13 +44,12 @@ def setup_logging():
         maxBytes=10*1024*1024,
         backupCount=5
     )
-    cmd_handler.setFormatter(logging.Formatter('%(message)s'))
+    cmd_handler.setFormatter(BrazilTimeFormatter(COMMAND_LOG_FORMAT, COMMAND_LOG_DATE_FORMAT))
 
     cmd_logger = logging.getLogger('team_analysis_commands')
     cmd_logger.setLevel(logging.INFO)
-    if cmd_logger.handlers:
-        cmd_logger.handlers.clear()
-    cmd_logger.addHandler(cmd_handler)
+    clear_log_handlers(cmd_logger)
+    cmd_logger.addHandler(queue_log_handlers(cmd_handler))
 
     return logger
 
@@ -80,6 +80,9 @@ class TeamAnalysisBot(commands.Bot):
         from src.bot import tasks
         await tasks.setup(self)
 
+        from src.bot.views import ConfigView
+        self.add_view(ConfigView(self))
+
         logger.info("Configuração do bot concluída!")
 
     async def on_ready(self):
@@ -74,7 +74,8 @@ async def check_and_send_changelog(bot: commands.Bot):
         return
 
     try:
-        changelog_channel = await bot.fetch_channel(int(changelog_channel_id))
+        changelog_channel_id = int(changelog_channel_id)
+        changelog_channel = bot.get_channel(changelog_channel_id) or await bot.fetch_channel(changelog_channel_id)
 
         all_versions = get_all_versions()
         logger.debug(f"Todas as versões disponíveis: {all_versions}")
@@ -1,19 +1,23 @@
 import logging
 from typing import Dict, List, Optional
 import asyncio
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import os
 
 import discord
 from discord import app_commands, ui
 from discord.ext import commands
 
-from src.utils.config import get_env, log_command, get_br_time, BRAZIL_TIMEZONE, parse_date_string, format_date_for_display
+from src.utils.config import get_env, log_command, get_br_time, parse_date_string, format_date_for_display, ADMIN_ROLE_ID, PO_ROLE_ID
+from src.utils.discord_cache import get_cached_user
+from src.utils.rate_limit import send_reminder
 from src.storage.feature_toggle import is_feature_enabled, toggle_feature
 from src.storage.daily import get_missing_updates, clear_all_daily_updates, get_missing_dates_for_user, get_user_daily_updates, get_all_daily_updates
 from src.storage.users import check_user_is_po, register_user as reg_user, remove_user as rem_user, get_user, update_user_nickname, get_all_users
 from src.storage.ignored_dates import get_all_ignored_dates, remove_ignored_date, should_ignore_date
+from src.bot.embeds import build_pending_embed
 from src.bot.views import ConfigView
+from src.bot.views.config_view import CONFIG_VIEW_TIMEOUT
 
 logger = logging.getLogger('team_analysis_bot')
 
@@ -23,6 +27,15 @@ class AdminCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+        daily_channel_id = get_env("DAILY_CHANNEL_ID")
+        try:
+            self.daily_channel_id = int(daily_channel_id) if daily_channel_id else None
+        except ValueError:
+            logger.warning(f"DAILY_CHANNEL_ID configurado com valor inválido: {daily_channel_id}")
+            self.daily_channel_id = None
+
+        self.admin_role_id = ADMIN_ROLE_ID or None
+
     async def _check_daily_collection_enabled(self, interaction: discord.Interaction) -> bool:
         """
         Verifica se as funcionalidades de daily e cobrança estão ativadas.
@@ -50,76 +63,63 @@ class AdminCommands(commands.Cog):
 
         return True
 
-    async def _process_management_reminder(self, missing_users: List[str], requester: discord.User) -> Dict[str, List[discord.User]]:
+    async def _process_management_reminder(self, missing_users: List[str], requester: discord.User,
+                                           now_br: Optional[datetime] = None) -> Dict[str, List[discord.User]]:
         """Processa uma cobrança iniciada pela gerência, enviando mensagens privadas."""
         pending_by_date: Dict[str, List[discord.User]] = {}
-        processed_users = []
 
         if not missing_users:
             return pending_by_date
 
-        for user_id in missing_users:
-            try:
-                user = await self.bot.fetch_user(int(user_id))
-                processed_users.append(user)
-
-                embed = discord.Embed(
-                    title="⚠️ Cobrança: Atualizações Diárias Pendentes",
-                    description=f"A equipe de gerência de projetos ({requester.mention}) notou que você está com atualizações diárias pendentes.",
-                    color=discord.Color.red()
-                )
-
-                yesterday = get_br_time() - timedelta(days=1)
-                yesterday_db = yesterday.strftime("%Y-%m-%d")
+        if now_br is None:
+            now_br = get_br_time()
+        yesterday = now_br - timedelta(days=1)
+        yesterday_db = yesterday.strftime("%Y-%m-%d")
 
-                if yesterday.weekday() >= 5:
-                    days_to_subtract = yesterday.weekday() - 4
-                    last_weekday = yesterday - timedelta(days=days_to_subtract)
-                    yesterday_db = last_weekday.strftime("%Y-%m-%d")
+        if yesterday.weekday() >= 5:
+            days_to_subtract = yesterday.weekday() - 4
+            last_weekday = yesterday - timedelta(days=days_to_subtract)
+            yesterday_db = last_weekday.strftime("%Y-%m-%d")
 
-                daily_channel_id = get_env("DAILY_CHANNEL_ID")
-                daily_channel = None
-
-                if daily_channel_id:
-                    try:
-                        daily_channel = await self.bot.fetch_channel(int(daily_channel_id))
-                    except (discord.NotFound, discord.Forbidden):
-                        pass
-
-                if daily_channel:
-                    embed.add_field(
-                        name="⏰ Solicitação Urgente",
-                        value=f"Por favor, use o comando `/daily` no canal {daily_channel.mention} para atualizar seu status o mais rápido possível.",
-                        inline=False
-                    )
-                else:
-                    embed.add_field(
-                        name="⏰ Solicitação Urgente",
-                        value="Por favor, use o comando `/daily` para atualizar seu status o mais rápido possível.",
-                        inline=False
-                    )
-
-                embed.add_field(
-                    name="📝 Lembrete",
-                    value="Manter suas atualizações diárias em dia é essencial para o acompanhamento do projeto pela equipe de gerência.",
-                    inline=False
-                )
+        daily_channel = None
+        if self.daily_channel_id is not None:
+            try:
+                daily_channel = self.bot.get_channel(self.daily_channel_id) or await self.bot.fetch_channel(self.daily_channel_id)
+            except (discord.NotFound, discord.Forbidden):
+                pass
 
-                embed.set_footer(text=f"Cobrança realizada em: {get_br_time().strftime('%d/%m/%Y %H:%M:%S')}")
+        embed = discord.Embed(
+            title="⚠️ Cobrança: Atualizações Diárias Pendentes",
+            description=f"A equipe de gerência de projetos ({requester.mention}) notou que você está com atualizações diárias pendentes.",
+            color=discord.Color.red()
+        )
 
-                await user.send(embed=embed)
+        if daily_channel:
+            embed.add_field(
+                name="⏰ Solicitação Urgente",
+                value=f"Por favor, use o comando `/daily` no canal {daily_channel.mention} para atualizar seu status o mais rápido possível.",
+                inline=False
+            )
+        else:
+            embed.add_field(
+                name="⏰ Solicitação Urgente",
+                value="Por favor, use o comando `/daily` para atualizar seu status o mais rápido possível.",
+                inline=False
+            )
 
-                if yesterday_db not in pending_by_date:
-                    pending_by_date[yesterday_db] = []
-                pending_by_date[yesterday_db].append(user)
+        embed.add_field(
+            name="📝 Lembrete",
+            value="Manter suas atualizações diárias em dia é essencial para o acompanhamento do projeto pela equipe de gerência.",
+            inline=False
+        )
 
-                logger.info(f"Cobrança gerencial enviada para o usuário {user_id}")
-                await asyncio.sleep(1)
+        embed.set_footer(text=f"Cobrança realizada em: {now_br.strftime('%d/%m/%Y %H:%M:%S')}")
 
-            except discord.HTTPException as e:
-                logger.error(f"Erro ao enviar cobrança para o usuário {user_id}: {str(e)}")
-            except Exception as e:
-                logger.error(f"Erro inesperado ao processar cobrança para o usuário {user_id}: {str(e)}")
+        user_ids = dict.fromkeys(int(user_id) for user_id in missing_users)
+        results = await asyncio.gather(*(send_reminder(self.bot, user_id, embed, "cobrança") for user_id in user_ids))
+        processed_users = [user for user in results if user is not None]
+        if processed_users:
+            pending_by_date[yesterday_db] = processed_users
 
         return pending_by_date
 
@@ -141,7 +141,7 @@ class AdminCommands(commands.Cog):
             interaction: A interação do Discord.
             funcionalidade: A funcionalidade para alternar.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -160,6 +160,15 @@ class AdminCommands(commands.Cog):
         was_enabled = is_feature_enabled(funcionalidade)
         new_state = toggle_feature(funcionalidade)
 
+        if new_state is None:
+            await interaction.response.send_message(
+                f"❌ Não foi possível alterar a funcionalidade **{funcionalidade}**. Tente novamente mais tarde.",
+                ephemeral=True
+            )
+            log_command("ERRO", interaction.user, f"/toggle funcionalidade={funcionalidade}",
+                       "Erro ao salvar a alteração no banco de dados")
+            return
+
         await interaction.response.send_message(
             f"{'✅' if new_state else '❌'} Funcionalidade **{funcionalidade}** foi {'ativada' if new_state else 'desativada'}.",
             ephemeral=False
@@ -177,7 +186,7 @@ class AdminCommands(commands.Cog):
         Args:
             interaction: A interação do Discord.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -281,7 +290,7 @@ class AdminCommands(commands.Cog):
             tipo: Tipo de usuário.
             usuario: Usuário a ser registrado.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -328,7 +337,7 @@ class AdminCommands(commands.Cog):
             interaction: A interação do Discord.
             usuario: Usuário a ser removido.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -378,7 +387,7 @@ class AdminCommands(commands.Cog):
             interaction: A interação do Discord.
             funcionalidade: A funcionalidade a ser configurada.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -438,7 +447,7 @@ class AdminCommands(commands.Cog):
                 inline=False
             )
 
-            view = ConfigView(self.bot, funcionalidade)
+            view = ConfigView(self.bot, funcionalidade, timeout=CONFIG_VIEW_TIMEOUT)
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
             log_command("INFO", interaction.user, f"/config funcionalidade={funcionalidade}", "Menu de opções de configuração exibido")
         else:
@@ -464,7 +473,7 @@ class AdminCommands(commands.Cog):
             interaction: A interação do Discord.
             id: ID da configuração a ser removida.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -495,9 +504,9 @@ class AdminCommands(commands.Cog):
         ignored_dates = get_all_ignored_dates()
         date_to_remove = None
 
-        for date in ignored_dates:
-            if date["id"] == id:
-                date_to_remove = date
+        for entry in ignored_dates:
+            if entry["id"] == id:
+                date_to_remove = entry
                 break
 
         if not date_to_remove:
@@ -509,13 +518,10 @@ class AdminCommands(commands.Cog):
             return
 
         if remove_ignored_date(id):
-            start_date = datetime.strptime(date_to_remove["start_date"], "%Y-%m-%d")
-            end_date = datetime.strptime(date_to_remove["end_date"], "%Y-%m-%d")
-
-            start_date_str = start_date.strftime("%d/%m/%Y")
-            end_date_str = end_date.strftime("%d/%m/%Y")
+            start_date_str = format_date_for_display(date_to_remove["start_date"])
+            end_date_str = format_date_for_display(date_to_remove["end_date"])
 
-            if start_date == end_date:
+            if date_to_remove["start_date"] == date_to_remove["end_date"]:
                 date_desc = f"**{start_date_str}**"
             else:
                 date_desc = f"de **{start_date_str}** até **{end_date_str}**"
@@ -540,7 +546,7 @@ class AdminCommands(commands.Cog):
         Args:
             interaction: A interação do Discord.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -585,21 +591,17 @@ class AdminCommands(commands.Cog):
         )
 
         for date_entry in ignored_dates:
-            start_date = datetime.strptime(date_entry["start_date"], "%Y-%m-%d")
-            end_date = datetime.strptime(date_entry["end_date"], "%Y-%m-%d")
-            created_at = datetime.strptime(date_entry["created_at"], "%Y-%m-%d %H:%M:%S")
+            start_date_str = format_date_for_display(date_entry["start_date"])
+            end_date_str = format_date_for_display(date_entry["end_date"])
+            created_at_str = datetime.fromisoformat(date_entry["created_at"]).strftime("%d/%m/%Y %H:%M:%S")
 
-            start_date_str = start_date.strftime("%d/%m/%Y")
-            end_date_str = end_date.strftime("%d/%m/%Y")
-            created_at_str = created_at.strftime("%d/%m/%Y %H:%M:%S")
-
-            if start_date == end_date:
+            if date_entry["start_date"] == date_entry["end_date"]:
                 date_desc = f"📆 **{start_date_str}**"
             else:
                 date_desc = f"📆 De **{start_date_str}** até **{end_date_str}**"
 
             try:
-                creator_user = await self.bot.fetch_user(int(date_entry["created_by"]))
+                creator_user = await get_cached_user(self.bot, int(date_entry["created_by"]))
                 creator_name = creator_user.display_name
             except:
                 creator_name = f"Usuário {date_entry['created_by']}"
@@ -631,7 +633,7 @@ class AdminCommands(commands.Cog):
             interaction: A interação do Discord.
             data: Data para testar.
         """
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -661,7 +663,7 @@ class AdminCommands(commands.Cog):
             return
 
         try:
-            date_obj = datetime.strptime(formatted_data, "%Y-%m-%d")
+            date_obj = date.fromisoformat(formatted_data)
 
             is_ignored = should_ignore_date(date_obj)
             formatted_date = format_date_for_display(formatted_data)
@@ -692,25 +694,24 @@ class AdminCommands(commands.Cog):
             return
 
         br_time = get_br_time()
+        br_date_display = br_time.strftime('%d/%m/%Y')
         is_weekend = br_time.weekday() >= 5
 
         weekend_notice = ""
         if is_weekend:
-            weekend_notice = f"\n\nℹ️ Hoje é fim de semana ({br_time.strftime('%d/%m/%Y')}). O comando verificará apenas atualizações pendentes de dias úteis."
+            weekend_notice = f"\n\nℹ️ Hoje é fim de semana ({br_date_display}). O comando verificará apenas atualizações pendentes de dias úteis."
 
         if should_ignore_date(br_time):
             await interaction.response.send_message(
-                f"⚠️ A data atual ({br_time.strftime('%d/%m/%Y')}) está configurada para ser ignorada na cobrança de daily.",
+                f"⚠️ A data atual ({br_date_display}) está configurada para ser ignorada na cobrança de daily.",
                 ephemeral=True
             )
             log_command("INFO", interaction.user, "/cobrar-daily", f"Data {br_time.strftime('%Y-%m-%d')} ignorada")
             return
 
-        daily_channel_id = get_env("DAILY_CHANNEL_ID")
-
-        if daily_channel_id and str(interaction.channel_id) != daily_channel_id:
+        if self.daily_channel_id is not None and interaction.channel_id != self.daily_channel_id:
             try:
-                daily_channel = await self.bot.fetch_channel(int(daily_channel_id))
+                daily_channel = self.bot.get_channel(self.daily_channel_id) or await self.bot.fetch_channel(self.daily_channel_id)
                 await interaction.response.send_message(
                     f"Este comando só pode ser usado no canal {daily_channel.mention}.",
                     ephemeral=True
@@ -723,16 +724,15 @@ class AdminCommands(commands.Cog):
             return
 
         user_id = str(interaction.user.id)
-        admin_role_id = get_env("ADMIN_ROLE_ID")
         has_permission = False
 
         if check_user_is_po(user_id):
             has_permission = True
             logger.info(f"Usuário {user_id} é PO e solicitou cobrança de atualizações diárias")
 
-        elif admin_role_id and interaction.guild:
-            member = interaction.guild.get_member(int(user_id))
-            if member and any(role.id == int(admin_role_id) for role in member.roles):
+        elif self.admin_role_id and interaction.guild:
+            member = interaction.guild.get_member(interaction.user.id)
+            if member and discord.utils.get(member.roles, id=self.admin_role_id) is not None:
                 has_permission = True
                 logger.info(f"Usuário {user_id} tem cargo de admin e solicitou cobrança de atualizações diárias")
 
@@ -752,33 +752,20 @@ class AdminCommands(commands.Cog):
             await interaction.followup.send(f"Todos os usuários estão com suas atualizações diárias em dia! 🎉{weekend_notice}")
             return
 
-        pending_by_date = await self._process_management_reminder(missing_users, interaction.user)
+        pending_by_date = await self._process_management_reminder(missing_users, interaction.user, br_time)
 
         if not pending_by_date:
             await interaction.followup.send(f"Não há atualizações pendentes para dias úteis.{weekend_notice}")
             return
 
-        embed = discord.Embed(
-            title="📊 Relatório de Cobrança de Atualizações",
-            description=f"A equipe de gerência de projetos ({interaction.user.mention}) solicitou uma cobrança das atualizações pendentes.{weekend_notice}",
-            color=discord.Color.brand_red()
+        embed = build_pending_embed(
+            "📊 Relatório de Cobrança de Atualizações",
+            f"A equipe de gerência de projetos ({interaction.user.mention}) solicitou uma cobrança das atualizações pendentes.{weekend_notice}",
+            discord.Color.brand_red(),
+            pending_by_date,
+            f"Cobrança solicitada em: {br_time.strftime('%d/%m/%Y %H:%M:%S')}"
         )
 
-        for date_str, users in pending_by_date.items():
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            date_obj = date_obj.replace(tzinfo=BRAZIL_TIMEZONE)
-            formatted_date = date_obj.strftime("%d/%m/%Y")
-
-            user_list = "\n".join([f"• {user.mention}" for user in users])
-
-            embed.add_field(
-                name=f"📅 Dia {formatted_date}",
-                value=user_list if user_list else "Nenhum usuário pendente.",
-                inline=False
-            )
-
-        embed.set_footer(text=f"Cobrança solicitada em: {get_br_time().strftime('%d/%m/%Y %H:%M:%S')}")
-
         await interaction.followup.send(embed=embed)
         logger.info(f"Cobrança de atualizações diárias executada por {interaction.user.id}")
 
@@ -804,8 +791,8 @@ class AdminCommands(commands.Cog):
         """
         logger.debug(f"Comando apelidar iniciado para usuário={usuario.id}, apelido='{apelido}'")
 
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
-        po_role_id = int(get_env("PO_ROLE_ID", "0"))
+        admin_role_id = ADMIN_ROLE_ID
+        po_role_id = PO_ROLE_ID
 
         has_permission = False
 
@@ -883,7 +870,7 @@ class AdminCommands(commands.Cog):
         if not await self._check_daily_collection_enabled(interaction):
             return
 
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -943,10 +930,11 @@ class AdminCommands(commands.Cog):
         missing_dates.sort(reverse=True)
 
         formatted_dates = []
-        today = get_br_time().date()
+        now_br = get_br_time()
+        today = now_br.date()
 
         for date_str in missing_dates:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+            date_obj = date.fromisoformat(date_str)
             days_ago = (today - date_obj).days
 
             if days_ago == 1:
@@ -974,7 +962,7 @@ class AdminCommands(commands.Cog):
                 inline=False
             )
 
-        embed.set_footer(text=f"Verificação realizada em {get_br_time().strftime('%d/%m/%Y %H:%M')}")
+        embed.set_footer(text=f"Verificação realizada em {now_br.strftime('%d/%m/%Y %H:%M')}")
 
         await interaction.followup.send(embed=embed, ephemeral=True)
         log_command("CONSULTA", interaction.user, f"/pendencias-daily usuario={usuario.name} periodo={periodo}",
@@ -989,13 +977,13 @@ class AdminCommands(commands.Cog):
         interaction: discord.Interaction,
         periodo: Optional[int] = 30
     ):
-        logger.debug(f"[pendencias-equipe] Iniciando comando com periodo={periodo}")
+        logger.debug("[pendencias-equipe] Iniciando comando com periodo=%s", periodo)
 
         if not await self._check_daily_collection_enabled(interaction):
             logger.debug("[pendencias-equipe] Funcionalidade de cobrança de daily desativada")
             return
 
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -1007,7 +995,7 @@ class AdminCommands(commands.Cog):
         if user and user['role'] == 'po':
             has_permission = True
 
-        logger.debug(f"[pendencias-equipe] Verificação de permissão: {has_permission}")
+        logger.debug("[pendencias-equipe] Verificação de permissão: %s", has_permission)
 
         if not has_permission:
             await interaction.response.send_message(
@@ -1042,7 +1030,7 @@ class AdminCommands(commands.Cog):
 
             logger.debug("[pendencias-equipe] Obtendo todos os usuários")
             all_users = get_all_users()
-            logger.debug(f"[pendencias-equipe] Total de usuários obtidos: {len(all_users) if all_users else 0}")
+            logger.debug("[pendencias-equipe] Total de usuários obtidos: %d", len(all_users) if all_users else 0)
 
             if not all_users:
                 await interaction.followup.send(
@@ -1054,7 +1042,7 @@ class AdminCommands(commands.Cog):
 
             logger.debug("[pendencias-equipe] Filtrando membros da equipe")
             team_members = [user for user in all_users if user.get('role') == 'teammember']
-            logger.debug(f"[pendencias-equipe] Total de membros da equipe: {len(team_members)}")
+            logger.debug("[pendencias-equipe] Total de membros da equipe: %d", len(team_members))
 
             if not team_members:
                 await interaction.followup.send(
@@ -1064,23 +1052,26 @@ class AdminCommands(commands.Cog):
                 log_command("INFO", interaction.user, f"/pendencias-equipe periodo={periodo}", "Nenhum membro da equipe registrado")
                 return
 
-            today = get_br_time().date()
+            now_br = get_br_time()
+            today = now_br.date()
             yesterday = today - timedelta(days=1)
             start_date = today - timedelta(days=periodo)
+            start_date_str = start_date.isoformat()
+            yesterday_str = yesterday.isoformat()
 
-            logger.debug(f"[pendencias-equipe] Pré-carregando atualizações diárias de {start_date.strftime('%Y-%m-%d')} a {yesterday.strftime('%Y-%m-%d')}")
+            logger.debug("[pendencias-equipe] Pré-carregando atualizações diárias de %s a %s", start_date_str, yesterday_str)
             all_daily_updates = get_all_daily_updates(
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=yesterday.strftime("%Y-%m-%d")
+                start_date=start_date_str,
+                end_date=yesterday_str
             )
-            logger.debug(f"[pendencias-equipe] Atualizações diárias carregadas para {len(all_daily_updates)} usuários")
+            logger.debug("[pendencias-equipe] Atualizações diárias carregadas para %d usuários", len(all_daily_updates))
 
             valid_dates = []
             current_date = start_date
             from src.storage.ignored_dates import should_ignore_date
 
             while current_date <= yesterday:
-                date_str = current_date.strftime("%Y-%m-%d")
+                date_str = current_date.isoformat()
                 is_weekday = current_date.weekday() < 5
                 should_check = is_weekday and not should_ignore_date(current_date)
 
@@ -1089,7 +1080,7 @@ class AdminCommands(commands.Cog):
 
                 current_date += timedelta(days=1)
 
-            logger.debug(f"[pendencias-equipe] Datas válidas para verificação: {len(valid_dates)}")
+            logger.debug("[pendencias-equipe] Datas válidas para verificação: %d", len(valid_dates))
 
             async def process_team_member(member):
                 try:
@@ -1100,12 +1091,12 @@ class AdminCommands(commands.Cog):
                         nickname = ""
 
                     try:
-                        discord_user = await self.bot.fetch_user(int(user_id))
+                        discord_user = await get_cached_user(self.bot, int(user_id))
                         user_mention = discord_user.mention
                         display_name = nickname if nickname else discord_user.display_name
                     except Exception as e:
                         user_mention = display_name = f"User {user_id}"
-                        logger.error(f"[pendencias-equipe] Erro ao buscar usuário Discord: {str(e)}")
+                        logger.error("[pendencias-equipe] Erro ao buscar usuário Discord: %s", e)
 
                     user_updates = all_daily_updates.get(user_id, [])
                     updated_dates = {update['report_date'] for update in user_updates}
@@ -1115,16 +1106,11 @@ class AdminCommands(commands.Cog):
                     if missing_dates:
                         missing_dates.sort(reverse=True)
 
-                        formatted_dates = []
-                        for date_str in missing_dates[:5]:
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                            formatted_date = date_obj.strftime("%d/%m/%Y")
-                            formatted_dates.append(formatted_date)
-
-                        date_list = ", ".join([f"**{date}**" for date in formatted_dates])
+                        date_list = ", ".join(f"**{format_date_for_display(date_str)}**" for date_str in missing_dates[:5])
 
-                        if len(missing_dates) > 5:
-                            date_list += f" e mais {len(missing_dates) - 5} datas..."
+                        count = len(missing_dates)
+                        if count > 5:
+                            date_list += f" e mais {count - 5} datas..."
 
                         return {
                             'user_id': user_id,
@@ -1132,7 +1118,9 @@ class AdminCommands(commands.Cog):
                             'user_mention': user_mention,
                             'missing_dates': missing_dates,
                             'date_list': date_list,
-                            'count': len(missing_dates),
+                            'count': count,
+                            'field_name': f"{display_name} ({count} pendências)",
+                            'field_value': f"{user_mention}\nDatas: {date_list}",
                             'has_pending': True
                         }
 
@@ -1142,7 +1130,7 @@ class AdminCommands(commands.Cog):
                     }
 
                 except Exception as e:
-                    logger.error(f"[pendencias-equipe] Erro ao processar membro {user_id}: {str(e)}")
+                    logger.error("[pendencias-equipe] Erro ao processar membro %s: %s", user_id, e)
                     logger.exception(e)
                     return {
                         'user_id': user_id,
@@ -1154,13 +1142,13 @@ class AdminCommands(commands.Cog):
 
             all_results = await asyncio.gather(*[process_team_member(member) for member in team_members])
 
-            logger.debug(f"[pendencias-equipe] Processamento paralelo concluído para {len(all_results)} membros")
+            logger.debug("[pendencias-equipe] Processamento paralelo concluído para %d membros", len(all_results))
 
             members_with_pending = [result for result in all_results if result.get('has_pending', False)]
             users_with_pending = len(members_with_pending)
             total_pending = sum(member['count'] for member in members_with_pending)
 
-            logger.debug(f"[pendencias-equipe] Membros com pendências: {users_with_pending}, total de pendências: {total_pending}")
+            logger.debug("[pendencias-equipe] Membros com pendências: %d, total de pendências: %d", users_with_pending, total_pending)
 
             members_with_pending.sort(key=lambda x: x['count'], reverse=True)
 
@@ -1172,8 +1160,8 @@ class AdminCommands(commands.Cog):
 
             for member_data in members_with_pending:
                 embed.add_field(
-                    name=f"{member_data['display_name']} ({member_data['count']} pendências)",
-                    value=f"{member_data['user_mention']}\nDatas: {member_data['date_list']}",
+                    name=member_data['field_name'],
+                    value=member_data['field_value'],
                     inline=False
                 )
 
@@ -1186,7 +1174,7 @@ class AdminCommands(commands.Cog):
             else:
                 embed.description += f"\n\n**Resumo:** {users_with_pending} membros com pendências, totalizando {total_pending} atualizações não enviadas."
 
-            embed.set_footer(text=f"Verificação realizada em {get_br_time().strftime('%d/%m/%Y %H:%M')}")
+            embed.set_footer(text=f"Verificação realizada em {now_br.strftime('%d/%m/%Y %H:%M')}")
 
             logger.debug("[pendencias-equipe] Enviando resposta final")
             await interaction.followup.send(embed=embed, ephemeral=True)
@@ -1195,7 +1183,7 @@ class AdminCommands(commands.Cog):
                       f"Verificados {len(team_members)} membros, {users_with_pending} com pendências")
 
         except Exception as e:
-            logger.error(f"[pendencias-equipe] ERRO CRÍTICO: {str(e)}")
+            logger.error("[pendencias-equipe] ERRO CRÍTICO: %s", e)
             logger.exception(e)
             try:
                 await interaction.followup.send(
@@ -3,26 +3,167 @@ Módulo de comandos de atualizações diárias para o Team Analysis Discord Bot.
 """
 
 from typing import Optional
+import asyncio
+import io
 import logging
-from datetime import datetime, timedelta
-import os
+from datetime import date, timedelta
 
 import discord
 from discord import app_commands
 from discord.ext import commands
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+import xlsxwriter
 
 from src.storage.feature_toggle import is_feature_enabled
-from src.storage.users import get_user, get_users_by_role, check_user_is_po, get_user_display_name
-from src.storage.daily import submit_daily_update, has_submitted_daily_update, get_user_daily_updates, get_all_daily_updates
-from src.utils.config import get_env, get_br_time, BRAZIL_TIMEZONE, log_command, parse_date_string
+from src.storage.users import get_user, check_user_is_po
+from src.storage.daily import submit_daily_update, has_submitted_daily_update, get_user_daily_updates, iter_all_daily_updates_flat, get_daily_update_user_ids
+from src.utils.config import get_env, get_br_time, BRAZIL_TIMEZONE, ADMIN_ROLE_ID, log_command, parse_date_string, parse_ymd_date, parse_iso_datetime
 from src.bot.modals import DailyUpdateModal
 from src.bot.views import DailyUpdateView
 
 logger = logging.getLogger('team_analysis_bot')
 
+HEADER_FORMAT = {'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+                 'align': 'center', 'valign': 'vcenter', 'border': 1}
+SUBHEADER_FORMAT = {'bold': True, 'font_color': '#000000', 'bg_color': '#D9E1F2',
+                    'align': 'center', 'valign': 'vcenter', 'border': 1}
+SUMMARY_TITLE_FORMAT = {'bold': True, 'font_size': 12}
+SUMMARY_CELL_FORMAT = {'border': 1}
+ALT_ROW_COLOR = '#F2F2F2'
+
+REPORT_ROW_COLUMNS = [
+    {'align': 'center', 'valign': 'vcenter', 'num_format': 'dd/mm/yyyy'},
+    {'align': 'left'},
+    {'align': 'center', 'valign': 'vcenter'},
+    {'text_wrap': True, 'valign': 'top'},
+    {'align': 'center', 'valign': 'vcenter', 'num_format': 'dd/mm/yyyy hh:mm'},
+]
+REPORT_COLUMN_WIDTHS = [15, 20, 15, 60, 18]
+
+VIEW_DAILY_MAX_FIELDS = 10
+
+NOT_REGISTERED_MESSAGE = "⚠️ Você não está registrado no sistema. Peça a um administrador para registrá-lo primeiro usando o comando `/registrar`."
+INVALID_DATE_MESSAGE = "⚠️ Formato de data inválido: {}. Formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY."
+INVALID_START_DATE_MESSAGE = "⚠️ Formato de data inicial inválido: {}. Formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY."
+INVALID_END_DATE_MESSAGE = "⚠️ Formato de data final inválido: {}. Formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY."
+
+
+def build_daily_report_workbook(discord_names: dict, start_date: str, end_date: str) -> bytes:
+    """
+    Monta a planilha do relatório de dailies e retorna o conteúdo do arquivo .xlsx.
+
+    Função síncrona, pensada para rodar fora do event loop via asyncio.to_thread.
+    A planilha é gravada em modo constant_memory: cada linha é descarregada ao
+    escrever a seguinte, por isso larguras, altura do cabeçalho e filtros são
+    definidos antes dos dados e o resumo fica em uma aba separada.
+
+    As atualizações são lidas direto do cursor do banco dentro desta função, sem
+    materializar a lista, e as estatísticas do resumo são acumuladas durante a escrita.
+
+    Args:
+        discord_names: Dicionário de user_id para nome de exibição no Discord (ou None)
+        start_date: Data inicial do relatório no formato YYYY-MM-DD
+        end_date: Data final do relatório no formato YYYY-MM-DD
+
+    Returns:
+        Bytes do arquivo Excel gerado
+    """
+    logger.debug("[DEBUG] Iniciando criação do workbook Excel...")
+    file_buffer = io.BytesIO()
+    wb = xlsxwriter.Workbook(file_buffer, {'constant_memory': True})
+    ws = wb.add_worksheet("Relatório Daily")
+
+    header_format = wb.add_format(HEADER_FORMAT)
+    row_formats_plain = [wb.add_format({**column, 'border': 1}) for column in REPORT_ROW_COLUMNS]
+    row_formats_alt = [wb.add_format({**column, 'border': 1, 'bg_color': ALT_ROW_COLOR}) for column in REPORT_ROW_COLUMNS]
+
+    for col, width in enumerate(REPORT_COLUMN_WIDTHS):
+        ws.set_column(col, col, width)
+
+    ws.set_row(0, 25)
+    ws.freeze_panes(1, 0)
+
+    headers = ["Data", "Usuário", "Papel", "Atualização", "Enviado em"]
+    ws.write_row(0, 0, headers, header_format)
+
+    role_display = {
+        "teammember": "Team Member",
+        "po": "Product Owner"
+    }
+
+    row = 1
+
+    last_report_date = None
+    date_obj_value = None
+    br_tz = BRAZIL_TIMEZONE
+    update_count = 0
+
+    for idx, update in enumerate(iter_all_daily_updates_flat(start_date, end_date)):
+        update_count += 1
+        try:
+            user_id = update['user_id']
+
+            report_date = update['report_date']
+            if report_date != last_report_date:
+                date_obj_value = date.fromisoformat(report_date)
+                last_report_date = report_date
+
+            row_formats = row_formats_alt if idx % 2 == 1 else row_formats_plain
+
+            discord_name = discord_names.get(user_id)
+            user_role = update['role'] or ""
+            stored_name = (update['nickname'] or update['user_name']) if user_role else None
+
+            if discord_name:
+                if stored_name and stored_name != discord_name:
+                    user_name = f"{discord_name} ({stored_name})"
+                else:
+                    user_name = discord_name
+            else:
+                user_name = stored_name or f"Usuário {user_id}"
+
+            role_name = role_display.get(user_role, user_role)
+
+            submitted_at = parse_iso_datetime(update['submitted_at']).astimezone(br_tz)
+            submitted_at_no_tz = submitted_at.replace(tzinfo=None)
+
+            ws.write_datetime(row, 0, date_obj_value, row_formats[0])
+            ws.write_string(row, 1, user_name, row_formats[1])
+            ws.write_string(row, 2, role_name, row_formats[2])
+            ws.write_string(row, 3, update['content'], row_formats[3])
+            ws.write_datetime(row, 4, submitted_at_no_tz, row_formats[4])
+
+            row += 1
+        except Exception as e:
+            logger.error("[DEBUG] Erro ao processar linha %d: %s", row, e)
+
+    logger.debug("[DEBUG] Planilha preenchida com %d atualizações", update_count)
+    ws.autofilter(0, 0, row - 1, len(REPORT_COLUMN_WIDTHS) - 1)
+
+    logger.debug("[DEBUG] Finalizando formatação da planilha")
+    try:
+        summary_ws = wb.add_worksheet("Resumo")
+        summary_ws.set_column(0, 0, 35)
+        summary_ws.set_column(1, 1, 25)
+
+        summary_ws.write(0, 0, "Resumo do Relatório", wb.add_format(SUMMARY_TITLE_FORMAT))
+        summary_ws.write_row(1, 0, ["Estatísticas", "Valor"], wb.add_format(SUBHEADER_FORMAT))
+
+        summary_data = [
+            ["Período do relatório", f"{start_date} a {end_date}"],
+            ["Total de atualizações", update_count],
+            ["Total de usuários", len(discord_names)],
+            ["Média de atualizações por usuário", f"{update_count/len(discord_names):.2f}" if discord_names else "0"]
+        ]
+
+        summary_cell_format = wb.add_format(SUMMARY_CELL_FORMAT)
+        for summary_row, item in enumerate(summary_data, 2):
+            summary_ws.write_row(summary_row, 0, item, summary_cell_format)
+
+    except Exception as e:
+        logger.error("[DEBUG] Erro ao formatar planilha: %s", e)
+
+    wb.close()
+    return file_buffer.getvalue()
 
 class DailyCommands(commands.Cog):
     """Comandos relacionados às atualizações diárias."""
@@ -30,6 +171,13 @@ class DailyCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+        daily_channel_id = get_env("DAILY_CHANNEL_ID")
+        try:
+            self.daily_channel_id = int(daily_channel_id) if daily_channel_id else None
+        except ValueError:
+            logger.warning(f"DAILY_CHANNEL_ID configurado com valor inválido: {daily_channel_id}")
+            self.daily_channel_id = None
+
     async def _check_daily_enabled(self, interaction: discord.Interaction) -> bool:
         """Verifica se a funcionalidade de daily está ativada."""
         if not is_feature_enabled("daily"):
@@ -41,6 +189,26 @@ class DailyCommands(commands.Cog):
             return False
         return True
 
+    async def _reply_error(self, interaction: discord.Interaction, message: str, command: str, reason: str,
+                           command_args: tuple = ()) -> None:
+        """
+        Responde a interação com uma mensagem de erro efêmera e registra o erro no log.
+
+        Usa followup quando a resposta já foi enviada ou adiada (defer).
+
+        Args:
+            interaction: A interação do Discord.
+            message: Mensagem exibida ao usuário.
+            command: Comando registrado no log, podendo conter marcadores %s.
+            reason: Motivo do erro registrado no log.
+            command_args: Valores para os marcadores de command.
+        """
+        if interaction.response.is_done():
+            await interaction.followup.send(content=message, ephemeral=True)
+        else:
+            await interaction.response.send_message(message, ephemeral=True)
+        log_command("ERRO", interaction.user, command, reason, command_args=command_args)
+
     @app_commands.command(name="daily", description="Envia ou atualiza sua atualização diária")
     @app_commands.describe(data="Data opcional (formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY)")
     async def daily_update(
@@ -62,23 +230,21 @@ class DailyCommands(commands.Cog):
         user = get_user(user_id)
 
         if not user:
-            await interaction.response.send_message(
-                "⚠️ Você não está registrado no sistema. Peça a um administrador para registrá-lo primeiro usando o comando `/registrar`.",
-                ephemeral=True
+            await self._reply_error(
+                interaction,
+                NOT_REGISTERED_MESSAGE,
+                "/daily", "Usuário não registrado"
             )
-            log_command("ERRO", interaction.user, "/daily", "Usuário não registrado")
             return
 
-        daily_channel_id = get_env("DAILY_CHANNEL_ID")
-        if daily_channel_id and interaction.channel_id != int(daily_channel_id):
+        if self.daily_channel_id and interaction.channel_id != self.daily_channel_id:
             try:
-                daily_channel = await self.bot.fetch_channel(int(daily_channel_id))
-                await interaction.response.send_message(
+                daily_channel = self.bot.get_channel(self.daily_channel_id) or await self.bot.fetch_channel(self.daily_channel_id)
+                await self._reply_error(
+                    interaction,
                     f"⚠️ Por favor, use o comando `/daily` no canal {daily_channel.mention} para enviar suas atualizações diárias.",
-                    ephemeral=True
+                    "/daily", f"Canal incorreto. Usou no canal #{interaction.channel.name} mas deveria ser #{daily_channel.name}"
                 )
-                log_command("ERRO", interaction.user, "/daily",
-                           f"Canal incorreto. Usou no canal #{interaction.channel.name} mas deveria ser #{daily_channel.name}")
                 return
             except (discord.NotFound, discord.Forbidden, ValueError):
                 pass
@@ -87,37 +253,35 @@ class DailyCommands(commands.Cog):
         if data:
             formatted_data = parse_date_string(data)
             if not formatted_data:
-                await interaction.response.send_message(
-                    f"⚠️ Formato de data inválido: {data}. Formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY.",
-                    ephemeral=True
+                await self._reply_error(
+                    interaction,
+                    INVALID_DATE_MESSAGE.format(data),
+                    "/daily data=%s", "Formato de data inválido", command_args=(data,)
                 )
-                log_command("ERRO", interaction.user, f"/daily data={data}", "Formato de data inválido")
                 return
 
-            try:
-                date_obj = datetime.strptime(formatted_data, "%Y-%m-%d")
-
-                today = get_br_time().date()
-                if date_obj.date() > today:
-                    await interaction.response.send_message(
-                        f"⚠️ Não é possível registrar atualizações para datas futuras. Hoje é {today.strftime('%d/%m/%Y')} no horário de Brasília.",
-                        ephemeral=True
-                    )
-                    log_command("ERRO", interaction.user, f"/daily data={data}", "Data no futuro")
-                    return
-            except ValueError:
-                await interaction.response.send_message(
+            date_obj = parse_ymd_date(formatted_data)
+            if date_obj is None:
+                await self._reply_error(
+                    interaction,
                     f"⚠️ Erro ao processar a data: {data}.",
-                    ephemeral=True
+                    "/daily data=%s", "Erro ao processar data", command_args=(data,)
+                )
+                return
+
+            today = get_br_time().date()
+            if date_obj > today:
+                await self._reply_error(
+                    interaction,
+                    f"⚠️ Não é possível registrar atualizações para datas futuras. Hoje é {today.strftime('%d/%m/%Y')} no horário de Brasília.",
+                    "/daily data=%s", "Data no futuro", command_args=(data,)
                 )
-                log_command("ERRO", interaction.user, f"/daily data={data}", "Erro ao processar data")
                 return
 
         if has_submitted_daily_update(user_id, formatted_data):
             if formatted_data:
-                date_obj = datetime.strptime(formatted_data, "%Y-%m-%d")
-                date_obj = date_obj.replace(tzinfo=BRAZIL_TIMEZONE)
-                formatted_date = date_obj.strftime("%d/%m/%Y")
+                date_obj = parse_ymd_date(formatted_data)
+                formatted_date = f"{date_obj.day:02d}/{date_obj.month:02d}/{date_obj.year}"
             else:
                 yesterday = get_br_time() - timedelta(days=1)
                 formatted_date = yesterday.strftime("%d/%m/%Y")
@@ -171,14 +335,15 @@ class DailyCommands(commands.Cog):
 
         user = get_user(user_id)
         if not user:
-            await interaction.response.send_message(
-                "⚠️ Você não está registrado no sistema. Peça a um administrador para registrá-lo primeiro usando o comando `/registrar`.",
-                ephemeral=True
+            await self._reply_error(
+                interaction,
+                NOT_REGISTERED_MESSAGE,
+                "/ver-daily periodo=%s", "Usuário não registrado", command_args=(periodo,)
             )
-            log_command("ERRO", interaction.user, f"/ver-daily periodo={periodo}", "Usuário não registrado")
             return
 
-        today = get_br_time().date()
+        now_br = get_br_time()
+        today = now_br.date()
 
         if periodo == "semana":
             start_date = (today - timedelta(days=7)).strftime("%Y-%m-%d")
@@ -189,14 +354,14 @@ class DailyCommands(commands.Cog):
             end_date = today.strftime("%Y-%m-%d")
             periodo_texto = "últimos 30 dias"
 
-        updates = get_user_daily_updates(user_id, start_date, end_date)
+        updates = get_user_daily_updates(user_id, start_date, end_date, limit=VIEW_DAILY_MAX_FIELDS + 1)
 
         if not updates:
             await interaction.response.send_message(
                 f"📝 Você não possui atualizações diárias registradas nos {periodo_texto}.",
                 ephemeral=True
             )
-            log_command("INFO", interaction.user, f"/ver-daily periodo={periodo}", "Nenhuma atualização encontrada")
+            log_command("INFO", interaction.user, "/ver-daily periodo=%s", "Nenhuma atualização encontrada", command_args=(periodo,))
             return
 
         embed = discord.Embed(
@@ -205,10 +370,12 @@ class DailyCommands(commands.Cog):
             color=discord.Color.blue()
         )
 
-        for update in updates[:10]:
-            report_date = datetime.strptime(update['report_date'], "%Y-%m-%d")
-            report_date = report_date.replace(tzinfo=BRAZIL_TIMEZONE)
-            formatted_date = report_date.strftime("%d/%m/%Y")
+        has_more = len(updates) > VIEW_DAILY_MAX_FIELDS
+        shown_updates = updates[:VIEW_DAILY_MAX_FIELDS]
+
+        for update in shown_updates:
+            report_date = date.fromisoformat(update['report_date'])
+            formatted_date = f"{report_date.day:02d}/{report_date.month:02d}/{report_date.year}"
 
             content = update['content']
             if len(content) > 1024:
@@ -220,14 +387,14 @@ class DailyCommands(commands.Cog):
                 inline=False
             )
 
-        if len(updates) > 10:
-            embed.set_footer(text=f"Mostrando 10 de {len(updates)} atualizações. Use períodos menores para ver mais detalhes. (Horário de Brasília)")
+        if has_more:
+            embed.set_footer(text=f"Mostrando {VIEW_DAILY_MAX_FIELDS} de mais de {VIEW_DAILY_MAX_FIELDS} atualizações. Use períodos menores para ver mais detalhes. (Horário de Brasília)")
         else:
-            embed.set_footer(text=f"Horário de Brasília: {get_br_time().strftime('%d/%m/%Y %H:%M:%S')}")
+            embed.set_footer(text=f"Horário de Brasília: {now_br.strftime('%d/%m/%Y %H:%M:%S')}")
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
-        log_command("CONSULTA", interaction.user, f"/ver-daily periodo={periodo}",
-                   f"Visualizadas {len(updates)} atualizações (mostrando {min(10, len(updates))})")
+        log_command("CONSULTA", interaction.user, "/ver-daily periodo=%s",
+                   f"Visualizadas {len(shown_updates)} atualizações{' (há mais no período)' if has_more else ''}", command_args=(periodo,))
 
     @app_commands.command(name="relatorio-daily", description="Visualiza as atualizações diárias de todos os usuários")
     @app_commands.describe(
@@ -248,12 +415,12 @@ class DailyCommands(commands.Cog):
             data_inicial: Data inicial nos formatos YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY (padrão: 30 dias atrás).
             data_final: Data final nos formatos YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY (padrão: hoje).
         """
-        logger.debug(f"[DEBUG] Iniciando comando relatorio-daily: data_inicial={data_inicial}, data_final={data_final}")
+        logger.debug("[DEBUG] Iniciando comando relatorio-daily: data_inicial=%s, data_final=%s", data_inicial, data_final)
 
         if not await self._check_daily_enabled(interaction):
             return
 
-        admin_role_id = int(get_env("ADMIN_ROLE_ID"))
+        admin_role_id = ADMIN_ROLE_ID
         has_permission = False
 
         if admin_role_id == 0:
@@ -270,7 +437,7 @@ class DailyCommands(commands.Cog):
                 "⚠️ Você não tem permissão para usar este comando. Apenas administradores e Product Owners podem ver relatórios.",
                 ephemeral=True
             )
-            log_command("PERMISSÃO NEGADA", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}")
+            log_command("PERMISSÃO NEGADA", interaction.user, "/relatorio-daily data_inicial=%s data_final=%s", command_args=(data_inicial, data_final))
             return
 
         today = get_br_time().date()
@@ -278,11 +445,11 @@ class DailyCommands(commands.Cog):
         if data_inicial:
             formatted_data_inicial = parse_date_string(data_inicial)
             if not formatted_data_inicial:
-                await interaction.response.send_message(
-                    f"⚠️ Formato de data inicial inválido: {data_inicial}. Formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY.",
-                    ephemeral=True
+                await self._reply_error(
+                    interaction,
+                    INVALID_START_DATE_MESSAGE.format(data_inicial),
+                    "/relatorio-daily data_inicial=%s data_final=%s", "Formato de data inicial inválido", command_args=(data_inicial, data_final)
                 )
-                log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}", "Formato de data inicial inválido")
                 return
             start_date = formatted_data_inicial
         else:
@@ -291,310 +458,121 @@ class DailyCommands(commands.Cog):
         if data_final:
             formatted_data_final = parse_date_string(data_final)
             if not formatted_data_final:
-                await interaction.response.send_message(
-                    f"⚠️ Formato de data final inválido: {data_final}. Formatos aceitos: YYYY-MM-DD, YYYY/MM/DD ou DD/MM/YYYY.",
-                    ephemeral=True
+                await self._reply_error(
+                    interaction,
+                    INVALID_END_DATE_MESSAGE.format(data_final),
+                    "/relatorio-daily data_inicial=%s data_final=%s", "Formato de data final inválido", command_args=(data_inicial, data_final)
                 )
-                log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}", "Formato de data final inválido")
                 return
             end_date = formatted_data_final
         else:
             end_date = today.strftime("%Y-%m-%d")
 
-        try:
-            start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end_date_obj = datetime.strptime(end_date, "%Y-%m-%d").date()
+        start_date_obj = parse_ymd_date(start_date)
+        end_date_obj = parse_ymd_date(end_date)
+        if start_date_obj is None or end_date_obj is None:
+            await self._reply_error(
+                interaction,
+                "⚠️ Formato de data inválido. Use o formato YYYY-MM-DD.",
+                "/relatorio-daily data_inicial=%s data_final=%s", "Formato de data inválido", command_args=(data_inicial, data_final)
+            )
+            return
 
-            if start_date_obj > end_date_obj:
-                await interaction.response.send_message(
-                    "⚠️ A data inicial não pode ser posterior à data final.",
-                    ephemeral=True
-                )
-                log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}", "Data inicial posterior à final")
-                return
+        if start_date_obj > end_date_obj:
+            await self._reply_error(
+                interaction,
+                "⚠️ A data inicial não pode ser posterior à data final.",
+                "/relatorio-daily data_inicial=%s data_final=%s", "Data inicial posterior à final", command_args=(data_inicial, data_final)
+            )
+            return
 
-            if (end_date_obj - start_date_obj).days > 60:
-                await interaction.response.send_message(
-                    "⚠️ O período máximo para relatórios é de 60 dias.",
-                    ephemeral=True
-                )
-                log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}", "Período muito longo")
-                return
-        except ValueError:
-            await interaction.response.send_message(
-                "⚠️ Formato de data inválido. Use o formato YYYY-MM-DD.",
-                ephemeral=True
+        if (end_date_obj - start_date_obj).days > 60:
+            await self._reply_error(
+                interaction,
+                "⚠️ O período máximo para relatórios é de 60 dias.",
+                "/relatorio-daily data_inicial=%s data_final=%s", "Período muito longo", command_args=(data_inicial, data_final)
             )
-            log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}", "Formato de data inválido")
             return
 
         await interaction.response.defer(ephemeral=True)
-        log_command("PROCESSANDO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}",
-                   "Iniciando geração do relatório")
+        log_command("PROCESSANDO", interaction.user, "/relatorio-daily data_inicial=%s data_final=%s",
+                   "Iniciando geração do relatório", command_args=(data_inicial, data_final))
 
-        logger.debug(f"[DEBUG] Buscando atualizações diárias no banco de dados...")
-        all_updates = get_all_daily_updates(start_date, end_date)
-        logger.debug(f"[DEBUG] Quantidade de usuários com updates: {len(all_updates)}")
+        logger.debug("[DEBUG] Buscando usuários com atualizações no período...")
+        report_user_ids = get_daily_update_user_ids(start_date, end_date)
 
-        if not all_updates:
+        if not report_user_ids:
             await interaction.followup.send(
                 f"📝 Não há atualizações diárias registradas no período de {start_date} a {end_date}.",
                 ephemeral=True
             )
-            log_command("INFO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}",
-                       "Nenhuma atualização encontrada")
+            log_command("INFO", interaction.user, "/relatorio-daily data_inicial=%s data_final=%s",
+                       "Nenhuma atualização encontrada", command_args=(data_inicial, data_final))
             return
 
-        logger.debug(f"[DEBUG] Obtendo lista de todos os usuários")
-        all_users = {}
-        for role in ["teammember", "po"]:
-            users = get_users_by_role(role)
-            for user in users:
-                all_users[user["user_id"]] = {
-                    "role": role,
-                    "name": get_user_display_name(user["user_id"], user),
-                    "user_obj": user
-                }
-
-        unique_user_ids = set()
-        for user_id in all_updates.keys():
-            unique_user_ids.add(user_id)
-
         discord_users = {}
-        logger.debug(f"[DEBUG] Pré-buscando {len(unique_user_ids)} usuários do Discord em lote")
-        for user_id in unique_user_ids:
-            try:
-                discord_user = await self.bot.fetch_user(int(user_id))
-                discord_users[user_id] = discord_user
-            except Exception as e:
-                logger.warning(f"[DEBUG] Não foi possível buscar usuário Discord {user_id}: {str(e)}")
-                discord_users[user_id] = None
-
-        logger.debug(f"[DEBUG] Organizando atualizações para o relatório")
-        sorted_updates = []
-        try:
-            for user_id, updates in all_updates.items():
-                for update in updates:
-                    sorted_updates.append({
-                        'user_id': user_id,
-                        'update': update
-                    })
-
-            sorted_updates.sort(key=lambda x: x['update']['report_date'], reverse=True)
-        except Exception as e:
-            logger.error(f"[DEBUG] Erro ao processar atualizações: {str(e)}")
-            await interaction.followup.send(
-                f"❌ Erro ao processar dados para o relatório: {str(e)}",
-                ephemeral=True
-            )
-            log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}",
-                      f"Erro ao processar dados: {str(e)}")
-            return
-
-        logger.debug(f"[DEBUG] Iniciando criação do workbook Excel...")
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Relatório Daily"
-
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        subheader_font = Font(bold=True, color="000000")
-        subheader_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        alt_row_fill = PatternFill(start_color="F2F2F2", end_color="F2F2F2", fill_type="solid")
-        border_all = Border(top=Side(style='thin'), left=Side(style='thin'),
-                           right=Side(style='thin'), bottom=Side(style='thin'))
-
-        align_center = Alignment(horizontal="center", vertical="center")
-        align_left = Alignment(horizontal="left")
-        align_wrap = Alignment(wrap_text=True, vertical="top")
-
-        headers = ["Data", "Usuário", "Papel", "Atualização", "Enviado em"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = align_center
-            cell.border = border_all
-
-        column_widths = [15, 20, 15, 60, 18]
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[get_column_letter(i)].width = width
-
-        ws.row_dimensions[1].height = 25
-
-        role_display = {
-            "teammember": "Team Member",
-            "po": "Product Owner"
+        users_to_fetch = []
+        for user_id in report_user_ids:
+            cached_user = interaction.guild.get_member(int(user_id)) if interaction.guild else None
+            if not cached_user:
+                cached_user = self.bot.get_user(int(user_id))
+
+            discord_users[user_id] = cached_user
+            if not cached_user:
+                users_to_fetch.append(user_id)
+
+        logger.debug("[DEBUG] Pré-buscando %d de %d usuários do Discord via API", len(users_to_fetch), len(discord_users))
+        fetch_semaphore = asyncio.Semaphore(5)
+
+        async def fetch_discord_user(user_id: str):
+            async with fetch_semaphore:
+                try:
+                    return await self.bot.fetch_user(int(user_id))
+                except Exception as e:
+                    logger.warning("[DEBUG] Não foi possível buscar usuário Discord %s: %s", user_id, e)
+                    return None
+
+        fetched_users = await asyncio.gather(*[fetch_discord_user(user_id) for user_id in users_to_fetch])
+        discord_users.update(zip(users_to_fetch, fetched_users))
+
+        discord_names = {
+            user_id: discord_user.display_name if discord_user else None
+            for user_id, discord_user in discord_users.items()
         }
 
-        row = 2
-        logger.debug(f"[DEBUG] Preenchendo planilha com {len(sorted_updates)} atualizações")
-
-        date_format_cache = {}
-        date_obj_cache = {}
-
-        even_rows = []
-        odd_rows = []
-        all_cells = []
-
-        for idx, item in enumerate(sorted_updates):
-            try:
-                user_id = item['user_id']
-                update = item['update']
-
-                report_date = update['report_date']
-                if report_date not in date_obj_cache:
-                    date_obj = datetime.strptime(report_date, "%Y-%m-%d")
-                    date_obj = date_obj.replace(tzinfo=BRAZIL_TIMEZONE)
-                    date_format_cache[report_date] = date_obj.strftime("%d/%m/%Y")
-                    date_obj_cache[report_date] = date_obj.date()
-                formatted_date = date_format_cache[report_date]
-                date_obj_value = date_obj_cache[report_date]
-
-                is_even_row = (idx % 2 == 0)
-                if is_even_row:
-                    even_rows.append(row)
-                else:
-                    odd_rows.append(row)
-
-                discord_user = discord_users.get(user_id)
-                user_data = all_users.get(user_id, {})
-                stored_user_obj = user_data.get("user_obj")
-
-                if discord_user:
-                    discord_name = discord_user.display_name
-                    if stored_user_obj:
-                        user_name = get_user_display_name(user_id, stored_user_obj)
-                        if user_name != discord_name:
-                            user_name = f"{discord_name} ({user_name})"
-                    else:
-                        user_name = discord_name
-                else:
-                    user_name = all_users.get(user_id, {}).get("name", f"Usuário {user_id}")
-
-                user_role = all_users.get(user_id, {}).get("role", "")
-                role_name = role_display.get(user_role, user_role)
-
-                submitted_at = datetime.fromisoformat(update['submitted_at'].replace('Z', '+00:00'))
-                submitted_at = submitted_at.astimezone(BRAZIL_TIMEZONE)
-                formatted_submit_time = submitted_at.strftime("%d/%m/%Y %H:%M")
-
-                submitted_at_no_tz = submitted_at.replace(tzinfo=None)
-
-                ws.cell(row=row, column=1, value=date_obj_value)
-                ws.cell(row=row, column=2, value=user_name)
-                ws.cell(row=row, column=3, value=role_name)
-                ws.cell(row=row, column=4, value=update['content'])
-                ws.cell(row=row, column=5, value=submitted_at_no_tz)
-
-                for col in range(1, 6):
-                    all_cells.append(ws.cell(row=row, column=col))
-
-                row += 1
-            except Exception as e:
-                logger.error(f"[DEBUG] Erro ao processar linha {row-1}: {str(e)}")
-
-        logger.debug(f"[DEBUG] Aplicando formatações em lote")
-
-        for cell in all_cells:
-            cell.border = border_all
-
-        for r in range(2, row):
-            date_cell = ws.cell(row=r, column=1)
-            date_cell.alignment = align_center
-            date_cell.number_format = "DD/MM/YYYY"
-
-            time_cell = ws.cell(row=r, column=5)
-            time_cell.alignment = align_center
-            time_cell.number_format = "DD/MM/YYYY HH:MM"
-    
-            ws.cell(row=r, column=2).alignment = align_left
-            ws.cell(row=r, column=3).alignment = align_center
-            ws.cell(row=r, column=4).alignment = align_wrap
-
-        for r in odd_rows:
-            for c in range(1, 6):
-                ws.cell(row=r, column=c).fill = alt_row_fill
-
-        logger.debug(f"[DEBUG] Finalizando formatação da planilha")
-        try:
-            ws.auto_filter.ref = f"A1:E{row-1}"
-            ws.freeze_panes = 'A2'
-
-            summary_row = row + 2
-            ws.cell(row=summary_row, column=1, value="Resumo do Relatório").font = Font(bold=True, size=12)
-            ws.merge_cells(start_row=summary_row, start_column=1, end_row=summary_row, end_column=5)
-            summary_row += 1
-
-            summary_headers = ["Estatísticas", "Valor"]
-            for col, header in enumerate(summary_headers, 1):
-                cell = ws.cell(row=summary_row, column=col)
-                cell.value = header
-                cell.font = subheader_font
-                cell.fill = subheader_fill
-                cell.border = border_all
-                cell.alignment = align_center
-            summary_row += 1
-
-            unique_users = set(item['user_id'] for item in sorted_updates)
-
-            summary_data = [
-                ["Período do relatório", f"{start_date} a {end_date}"],
-                ["Total de atualizações", len(sorted_updates)],
-                ["Total de usuários", len(unique_users)],
-                ["Média de atualizações por usuário", f"{len(sorted_updates)/len(unique_users):.2f}" if unique_users else "0"]
-            ]
-
-            for item in summary_data:
-                ws.cell(row=summary_row, column=1, value=item[0]).border = border_all
-                ws.cell(row=summary_row, column=2, value=item[1]).border = border_all
-                summary_row += 1
-
-        except Exception as e:
-            logger.error(f"[DEBUG] Erro ao formatar planilha: {str(e)}")
-
         file_name = f"relatorio_daily_{start_date}_{end_date}.xlsx"
 
         try:
-            logger.debug(f"[DEBUG] Salvando planilha em {file_name}")
-            wb.save(file_name)
-            logger.debug(f"[DEBUG] Planilha salva com sucesso")
+            logger.debug("[DEBUG] Gerando planilha %s em memória", file_name)
+            report_data = await asyncio.to_thread(
+                build_daily_report_workbook, discord_names, start_date, end_date
+            )
+            logger.debug("[DEBUG] Planilha gerada com sucesso")
         except Exception as e:
-            logger.error(f"[DEBUG] Erro ao salvar planilha: {str(e)}")
-            await interaction.followup.send(
-                content=f"❌ Erro ao gerar o arquivo Excel: {str(e)}",
-                ephemeral=True
+            logger.error("[DEBUG] Erro ao salvar planilha: %s", e)
+            await self._reply_error(
+                interaction,
+                f"❌ Erro ao gerar o arquivo Excel: {str(e)}",
+                "/relatorio-daily data_inicial=%s data_final=%s", f"Erro ao salvar arquivo Excel: {str(e)}", command_args=(data_inicial, data_final)
             )
-            log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}",
-                       f"Erro ao salvar arquivo Excel: {str(e)}")
             return
 
         try:
-            logger.debug(f"[DEBUG] Enviando arquivo {file_name} para o Discord")
+            logger.debug("[DEBUG] Enviando arquivo %s para o Discord", file_name)
             await interaction.followup.send(
                 content=f"📊 Relatório de atualizações diárias ({start_date} a {end_date})",
-                file=discord.File(file_name),
+                file=discord.File(io.BytesIO(report_data), filename=file_name),
                 ephemeral=True
             )
-            logger.debug(f"[DEBUG] Arquivo enviado com sucesso")
+            logger.debug("[DEBUG] Arquivo enviado com sucesso")
 
-            log_command("RELATÓRIO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}",
-                       f"Relatório Excel gerado com sucesso")
+            log_command("RELATÓRIO", interaction.user, "/relatorio-daily data_inicial=%s data_final=%s",
+                       f"Relatório Excel gerado com sucesso", command_args=(data_inicial, data_final))
 
         except Exception as e:
-            logger.error(f"[DEBUG] Erro ao enviar arquivo: {str(e)}")
-            await interaction.followup.send(
-                content=f"❌ Erro ao enviar o arquivo: {str(e)}",
-                ephemeral=True
+            logger.error("[DEBUG] Erro ao enviar arquivo: %s", e)
+            await self._reply_error(
+                interaction,
+                f"❌ Erro ao enviar o arquivo: {str(e)}",
+                "/relatorio-daily data_inicial=%s data_final=%s", f"Erro ao enviar arquivo: {str(e)}", command_args=(data_inicial, data_final)
             )
-            log_command("ERRO", interaction.user, f"/relatorio-daily data_inicial={data_inicial} data_final={data_final}",
-                       f"Erro ao enviar arquivo: {str(e)}")
-
-        finally:
-            try:
-                if os.path.exists(file_name):
-                    logger.debug(f"[DEBUG] Removendo arquivo temporário {file_name}")
-                    os.remove(file_name)
-            except Exception as e:
-                logger.error(f"[DEBUG] Erro ao remover arquivo temporário: {str(e)}")
\ No newline at end of file
@@ -1,21 +1,89 @@
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from src.utils.config import get_env, log_command
+from src.utils.config import get_env, log_command, get_rest_semaphore
 from src.storage.users import get_users_by_role, get_user
 
 logger = logging.getLogger('team_analysis_bot')
 
+QUERY_MEMBERS_LIMIT = 100
+FETCH_USER_CONCURRENCY = 5
+USER_LIST_PAGE_MAX_CHARS = 3900
+
+TIPO_DISPLAY = {
+    "teammember": "Team Members",
+    "po": "Product Owners",
+    "all": "Todos os Usuários"
+}
+
 class UserCommands(commands.Cog):
     """Comandos relacionados a gerenciamento de usuários."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    async def _resolve_discord_users(self, guild: Optional[discord.Guild], user_ids: List[str]) -> Dict[str, Union[discord.Member, discord.User]]:
+        """
+        Resolve os usuários do Discord, priorizando o cache local.
+
+        Membros fora do cache do servidor são buscados em lote pelo gateway e os
+        restantes via API, com um número limitado de requisições simultâneas.
+
+        Args:
+            guild: Servidor onde o comando foi executado, se houver.
+            user_ids: IDs dos usuários a resolver.
+
+        Returns:
+            Dicionário de ID do usuário para o membro ou usuário encontrado.
+        """
+        resolved: Dict[str, Union[discord.Member, discord.User]] = {}
+        missing = []
+
+        get_member = guild.get_member if guild else None
+        for user_id, member_id in zip(user_ids, [int(user_id) for user_id in user_ids]):
+            member = get_member(member_id) if get_member else None
+            if member:
+                resolved[user_id] = member
+            else:
+                missing.append((user_id, member_id))
+
+        logger.debug(f"{len(resolved)} usuários encontrados no cache, {len(missing)} a buscar")
+
+        if guild and missing:
+            for i in range(0, len(missing), QUERY_MEMBERS_LIMIT):
+                chunk = [member_id for _, member_id in missing[i:i + QUERY_MEMBERS_LIMIT]]
+                try:
+                    members = await guild.query_members(user_ids=chunk, limit=QUERY_MEMBERS_LIMIT, cache=True)
+                except (asyncio.TimeoutError, discord.ClientException) as e:
+                    logger.warning(f"Erro ao consultar membros do servidor em lote: {str(e)}")
+                    continue
+
+                for member in members:
+                    resolved[str(member.id)] = member
+
+            missing = [(user_id, member_id) for user_id, member_id in missing if user_id not in resolved]
+
+        if missing:
+            fetch_semaphore = asyncio.Semaphore(FETCH_USER_CONCURRENCY)
+
+            async def fetch_user(member_id: int):
+                async with fetch_semaphore:
+                    return await self.bot.fetch_user(member_id)
+
+            results = await asyncio.gather(*(fetch_user(member_id) for _, member_id in missing), return_exceptions=True)
+            for (user_id, _), result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Erro ao buscar usuário {user_id}: {str(result)}")
+                else:
+                    resolved[user_id] = result
+
+        return resolved
+
     @app_commands.command(name="listar-usuarios", description="Lista todos os usuários registrados")
     @app_commands.describe(tipo="Tipo de usuário a listar")
     @app_commands.choices(tipo=[
@@ -51,97 +119,70 @@ class UserCommands(commands.Cog):
                     f"⚠️ Não há usuários do tipo '{tipo}' registrados.",
                     ephemeral=True
                 )
-                log_command("INFO", interaction.user, f"/listar-usuarios tipo={tipo}", "Nenhum usuário encontrado")
+                log_command("INFO", interaction.user, "/listar-usuarios tipo=%s", "Nenhum usuário encontrado", command_args=(tipo,))
                 logger.info(f"Nenhum usuário do tipo '{tipo}' encontrado")
                 return
 
             logger.debug("Iniciando processamento dos usuários para exibição")
-            user_strings = []
 
             guild = interaction.guild
-
-            batch_size = 5
-            total_users = len(users)
-
-            for i in range(0, total_users, batch_size):
-                batch = users[i:i+batch_size]
-                batch_strings = []
-
-                for j, user_data in enumerate(batch):
-                    user_id = user_data["user_id"]
-                    user_index = i + j
-                    logger.debug(f"Processando usuário {user_index+1}/{total_users}: ID={user_id}")
-
-                    nickname = user_data.get("nickname")
-
-                    try:
-                        if guild:
-                            member = guild.get_member(int(user_id))
-                            if member:
-                                display_name = member.display_name
-                                if nickname:
-                                    user_string = f"• {member.mention} ({display_name}) - ({nickname})"
-                                else:
-                                    user_string = f"• {member.mention} ({display_name})"
-                                logger.debug(f"Usuário {user_id} encontrado localmente: {display_name}")
-                                batch_strings.append(user_string)
-                                continue
-
-                        user = await self.bot.fetch_user(int(user_id))
-                        display_name = user.display_name
-                        if nickname:
-                            user_string = f"• {user.mention} ({display_name}) - ({nickname})"
-                        else:
-                            user_string = f"• {user.mention} ({display_name})"
-                        logger.debug(f"Usuário {user_id} encontrado via API: {display_name}")
-
-                    except Exception as e:
-                        if nickname:
-                            user_string = f"• ID: {user_id} (Usuário não encontrado) - ({nickname})"
-                        else:
-                            user_string = f"• ID: {user_id} (Usuário não encontrado)"
-                        logger.error(f"Erro ao buscar usuário {user_id}: {str(e)}")
-
-                    batch_strings.append(user_string)
-
-                user_strings.extend(batch_strings)
-
-                if (i + batch_size) % 10 == 0 and i > 0 and i + batch_size < total_users:
-                    progress = min(100, int(((i + batch_size) / total_users) * 100))
-                    logger.debug(f"Progresso: {progress}% ({i + batch_size}/{total_users})")
-
-            tipo_display = {
-                "teammember": "Team Members",
-                "po": "Product Owners",
-                "all": "Todos os Usuários"
-            }.get(tipo, tipo)
-
-            logger.debug(f"Criando embed com {len(user_strings)} usuários")
-
-            if len("\n".join(user_strings)) > 4000:
-                logger.warning(f"Lista de usuários muito grande ({len(user_strings)} usuários), dividindo em múltiplas mensagens")
-
-                page_size = 20
-                pages = [user_strings[i:i + page_size] for i in range(0, len(user_strings), page_size)]
-                logger.debug(f"Lista dividida em {len(pages)} páginas")
-
+            async with get_rest_semaphore():
+                resolved_users = await self._resolve_discord_users(guild, [user_data["user_id"] for user_data in users])
+
+            def format_user(user_data) -> str:
+                user_id = user_data["user_id"]
+                nickname = user_data.get("nickname")
+                user = resolved_users.get(user_id)
+
+                if user:
+                    user_string = f"• {user.mention} ({user.display_name})"
+                else:
+                    user_string = f"• ID: {user_id} (Usuário não encontrado)"
+
+                if nickname:
+                    user_string += f" - ({nickname})"
+                return user_string
+
+            pages = []
+            current_page = []
+            current_length = 0
+            for user_data in users:
+                user_string = format_user(user_data)
+                if current_page and current_length + len(user_string) > USER_LIST_PAGE_MAX_CHARS:
+                    pages.append(current_page)
+                    current_page = []
+                    current_length = 0
+                current_page.append(user_string)
+                current_length += len(user_string) + 1
+            pages.append(current_page)
+
+            tipo_display = TIPO_DISPLAY.get(tipo, tipo)
+
+            logger.debug(f"Criando embed com {len(users)} usuários")
+
+            if len(pages) > 1:
+                logger.warning(f"Lista de usuários muito grande ({len(users)} usuários), dividindo em {len(pages)} mensagens")
+
+                shown_count = 0
                 for i, page in enumerate(pages):
                     page_embed = discord.Embed(
                         title=f"📋 Lista de Usuários: {tipo_display} - Página {i+1}/{len(pages)}",
                         description="\n".join(page),
                         color=discord.Color.blue()
                     )
-                    page_embed.set_footer(text=f"Total: {len(users)} usuários (Mostrando {i*page_size+1}-{min((i+1)*page_size, len(users))})")
+                    page_embed.set_footer(text=f"Total: {len(users)} usuários (Mostrando {shown_count+1}-{shown_count+len(page)})")
+                    shown_count += len(page)
 
                     await interaction.followup.send(embed=page_embed, ephemeral=True)
                     logger.debug(f"Enviada página {i+1}/{len(pages)}")
 
-                log_command("LISTAGEM", interaction.user, f"/listar-usuarios tipo={tipo}", f"Listados {len(users)} usuários em {len(pages)} páginas")
+                log_command("LISTAGEM", interaction.user, "/listar-usuarios tipo=%s", "Listados %d usuários em %d páginas",
+                            len(users), len(pages), command_args=(tipo,))
                 logger.info(f"Listados {len(users)} usuários do tipo '{tipo}' em {len(pages)} páginas para {interaction.user.name} (ID: {interaction.user.id})")
             else:
                 embed = discord.Embed(
                     title=f"📋 Lista de Usuários: {tipo_display}",
-                    description="\n".join(user_strings) if user_strings else "Nenhum usuário encontrado.",
+                    description="\n".join(pages[0]) if pages[0] else "Nenhum usuário encontrado.",
                     color=discord.Color.blue()
                 )
 
@@ -149,7 +190,7 @@ class UserCommands(commands.Cog):
 
                 logger.debug("Enviando resposta com a lista de usuários")
                 await interaction.followup.send(embed=embed, ephemeral=True)
-                log_command("LISTAGEM", interaction.user, f"/listar-usuarios tipo={tipo}", f"Listados {len(users)} usuários")
+                log_command("LISTAGEM", interaction.user, "/listar-usuarios tipo=%s", "Listados %d usuários", len(users), command_args=(tipo,))
                 logger.info(f"Listados {len(users)} usuários do tipo '{tipo}' para {interaction.user.name} (ID: {interaction.user.id})")
 
         except Exception as e:
@@ -158,4 +199,4 @@ class UserCommands(commands.Cog):
                 f"⚠️ Ocorreu um erro ao processar o comando: {str(e)}",
                 ephemeral=True
             )
-            log_command("ERRO", interaction.user, f"/listar-usuarios tipo={tipo}", f"Erro: {str(e)}")
\ No newline at end of file
+            log_command("ERRO", interaction.user, "/listar-usuarios tipo=%s", "Erro: %s", e, command_args=(tipo,))
\ No newline at end of file
@@ -0,0 +1,76 @@
+from typing import Dict, Iterable, Iterator, List
+
+import discord
+
+from src.utils.config import format_date_for_display
+
+EMBED_FIELD_MAX_CHARS = 1024
+
+
+def chunk_lines(lines: Iterable[str], max_chars: int = EMBED_FIELD_MAX_CHARS) -> Iterator[str]:
+    """
+    Agrupa linhas em blocos separados por quebra de linha com no máximo `max_chars` caracteres.
+
+    Args:
+        lines: Linhas a agrupar.
+        max_chars: Tamanho máximo de cada bloco.
+
+    Yields:
+        Blocos de texto prontos para usar como valor de um campo de embed.
+    """
+    current: List[str] = []
+    length = 0
+
+    for line in lines:
+        added = len(line) + (1 if current else 0)
+        if current and length + added > max_chars:
+            yield "\n".join(current)
+            current = []
+            length = 0
+            added = len(line)
+        current.append(line)
+        length += added
+
+    if current:
+        yield "\n".join(current)
+
+
+def build_pending_embed(
+    title: str,
+    description: str,
+    color: discord.Color,
+    pending_by_date: Dict[str, List[discord.User]],
+    footer_text: str
+) -> discord.Embed:
+    """
+    Monta o embed que lista os usuários com atualizações diárias pendentes, um campo por data.
+
+    Args:
+        title: Título do embed.
+        description: Descrição do embed.
+        color: Cor do embed.
+        pending_by_date: Usuários pendentes agrupados por data (YYYY-MM-DD).
+        footer_text: Texto do rodapé.
+
+    Returns:
+        O embed montado.
+    """
+    embed = discord.Embed(title=title, description=description, color=color)
+
+    for date_str, users in pending_by_date.items():
+        field_name = f"📅 Dia {format_date_for_display(date_str)}"
+        chunks = list(chunk_lines(f"• {user.mention}" for user in users))
+
+        if not chunks:
+            embed.add_field(name=field_name, value="Nenhum usuário pendente.", inline=False)
+            continue
+
+        for index, chunk in enumerate(chunks, start=1):
+            embed.add_field(
+                name=f"{field_name} ({index}/{len(chunks)})" if len(chunks) > 1 else field_name,
+                value=chunk,
+                inline=False
+            )
+
+    embed.set_footer(text=footer_text)
+    return embed
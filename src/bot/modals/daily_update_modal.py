@@ -1,9 +1,9 @@
 import discord
 from discord import ui
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 
-from src.utils.config import get_br_time, BRAZIL_TIMEZONE, log_command
+from src.utils.config import get_br_time, log_command, format_date_for_display
 from src.storage.daily import submit_daily_update
 
 class DailyUpdateModal(ui.Modal, title="Atualização Diária"):
@@ -18,16 +18,19 @@ class DailyUpdateModal(ui.Modal, title="Atualização Diária"):
         max_length=1000
     )
 
+    report_date: Optional[str] = None
+    report_date_formatted: Optional[str] = None
+    user: Optional[discord.User] = None
+
     def __init__(self, report_date: Optional[str] = None, user: discord.User = None):
         super().__init__()
-        self.report_date = report_date
-        self.user = user
+        if user is not None:
+            self.user = user
 
         if report_date:
-            date_obj = datetime.strptime(report_date, "%Y-%m-%d")
-            date_obj = date_obj.replace(tzinfo=BRAZIL_TIMEZONE)
-            date_formatted = date_obj.strftime("%d/%m/%Y")
-            self.daily_content.placeholder = f"Descreva o que você fez em {date_formatted}..."
+            self.report_date = report_date
+            self.report_date_formatted = format_date_for_display(report_date)
+            self.daily_content.placeholder = f"Descreva o que você fez em {self.report_date_formatted}..."
 
     async def on_submit(self, interaction: discord.Interaction):
         """Chamado quando o usuário envia o formulário."""
@@ -37,16 +40,15 @@ class DailyUpdateModal(ui.Modal, title="Atualização Diária"):
         success, message = submit_daily_update(user_id, content, self.report_date)
 
         if success:
-            if self.report_date:
-                date_obj = datetime.strptime(self.report_date, "%Y-%m-%d")
-                date_obj = date_obj.replace(tzinfo=BRAZIL_TIMEZONE)
-                date_formatted = date_obj.strftime("%d/%m/%Y")
-                date_display = f"**{date_formatted}**"
-                report_date_log = date_formatted
+            now_br = get_br_time()
+
+            if self.report_date_formatted:
+                date_display = f"**{self.report_date_formatted}**"
+                report_date_log = self.report_date_formatted
             else:
-                yesterday = get_br_time() - timedelta(days=1)
-                date_display = f"**{yesterday.strftime('%d/%m/%Y')}**"
-                report_date_log = yesterday.strftime('%d/%m/%Y')
+                yesterday = now_br - timedelta(days=1)
+                report_date_log = f"{yesterday.day:02d}/{yesterday.month:02d}/{yesterday.year}"
+                date_display = f"**{report_date_log}**"
 
             embed = discord.Embed(
                 title="📝 Nova Atualização Diária",
@@ -60,17 +62,17 @@ class DailyUpdateModal(ui.Modal, title="Atualização Diária"):
                 inline=False
             )
 
-            current_time_br = get_br_time().strftime("%d/%m/%Y %H:%M:%S")
+            current_time_br = now_br.strftime("%d/%m/%Y %H:%M:%S")
             embed.set_footer(text=f"Horário de Brasília: {current_time_br}")
 
             await interaction.response.send_message(embed=embed, ephemeral=False)
 
             log_command("DAILY UPDATE", interaction.user, "/daily",
-                       f"Atualização para {report_date_log} registrada com sucesso ({len(content)} caracteres)")
+                       "Atualização para %s registrada com sucesso (%d caracteres)", report_date_log, len(content))
         else:
             await interaction.response.send_message(
                 f"⚠️ {message}",
                 ephemeral=True
             )
 
-            log_command("ERRO", interaction.user, "/daily", f"Erro: {message}")
\ No newline at end of file
+            log_command("ERRO", interaction.user, "/daily", "Erro: %s", message)
\ No newline at end of file
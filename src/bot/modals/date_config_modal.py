@@ -1,10 +1,9 @@
 import discord
 from discord import ui
 import logging
-from datetime import datetime
 
-from src.utils.config import get_br_time, log_command
-from src.storage.ignored_dates import add_ignored_date, get_all_ignored_dates, remove_ignored_date, parse_date_config
+from src.utils.config import get_br_time, log_command, format_date_for_display
+from src.storage.ignored_dates import replace_ignored_dates, parse_date_config
 
 logger = logging.getLogger('team_analysis_bot')
 
@@ -41,24 +40,14 @@ class DateConfigModal(ui.Modal, title="Configurar Datas Ignoradas - Cobrança Da
                 log_command("ERRO", interaction.user, "/config daily_collection", "Formato de data inválido")
                 return
 
-            existing_dates = get_all_ignored_dates()
-            for date_entry in existing_dates:
-                remove_ignored_date(date_entry["id"])
-
-            success_count = 0
-            for start_date, end_date in date_pairs:
-                if add_ignored_date(start_date, end_date, str(interaction.user.id)):
-                    success_count += 1
+            success_count = replace_ignored_dates(date_pairs, str(interaction.user.id))
 
             formatted_dates = []
             for start_date, end_date in date_pairs:
                 if start_date == end_date:
-                    date_obj = datetime.strptime(start_date, "%Y-%m-%d")
-                    formatted_dates.append(f"• {date_obj.strftime('%d/%m/%Y')}")
+                    formatted_dates.append(f"• {format_date_for_display(start_date)}")
                 else:
-                    start_obj = datetime.strptime(start_date, "%Y-%m-%d")
-                    end_obj = datetime.strptime(end_date, "%Y-%m-%d")
-                    formatted_dates.append(f"• {start_obj.strftime('%d/%m/%Y')} até {end_obj.strftime('%d/%m/%Y')}")
+                    formatted_dates.append(f"• {format_date_for_display(start_date)} até {format_date_for_display(end_date)}")
 
             embed = discord.Embed(
                 title="✅ Configuração de Datas Ignoradas",
@@ -76,7 +65,7 @@ class DateConfigModal(ui.Modal, title="Configurar Datas Ignoradas - Cobrança Da
             embed.set_footer(text=f"Configurado por: {interaction.user.display_name} • {get_br_time().strftime('%d/%m/%Y %H:%M:%S')}")
 
             await interaction.followup.send(embed=embed, ephemeral=True)
-            log_command("INFO", interaction.user, "/config daily_collection", f"Configuradas {success_count} datas ignoradas")
+            log_command("INFO", interaction.user, "/config daily_collection", "Configuradas %d datas ignoradas", success_count)
 
         except Exception as e:
             logger.error(f"Erro ao processar o modal de configuração: {str(e)}")
@@ -84,4 +73,4 @@ class DateConfigModal(ui.Modal, title="Configurar Datas Ignoradas - Cobrança Da
                 f"❌ Ocorreu um erro ao processar a configuração: {str(e)}",
                 ephemeral=True
             )
-            log_command("ERRO", interaction.user, "/config daily_collection", f"Erro: {str(e)}")
\ No newline at end of file
+            log_command("ERRO", interaction.user, "/config daily_collection", "Erro: %s", e)
\ No newline at end of file
@@ -1,7 +1,8 @@
 import discord
 from discord import ui
 
-from src.utils.config import get_br_time, get_env, log_command
+from src.utils.config import get_br_time, get_env, log_command, get_rest_semaphore
+from src.utils.discord_cache import get_cached_user
 
 class SupportModal(ui.Modal, title="Suporte - Enviar Mensagem"):
     """Modal para envio de mensagens de suporte, erros ou sugestões."""
@@ -40,9 +41,9 @@ class SupportModal(ui.Modal, title="Suporte - Enviar Mensagem"):
             log_command("ERRO", interaction.user, "/suporte", "SUPPORT_USER_ID não configurado")
             return
 
-        try:
-            support_user = await interaction.client.fetch_user(int(support_user_id))
+        await interaction.response.defer(ephemeral=True, thinking=True)
 
+        try:
             embed = discord.Embed(
                 title=f"📩 Nova Mensagem de Suporte: {title}",
                 description=f"**Enviado por:** {interaction.user.mention} ({interaction.user.name}, ID: {interaction.user.id})",
@@ -72,30 +73,32 @@ class SupportModal(ui.Modal, title="Suporte - Enviar Mensagem"):
             current_time_br = get_br_time().strftime("%d/%m/%Y %H:%M:%S")
             embed.set_footer(text=f"Horário de Brasília: {current_time_br}")
 
-            await support_user.send(embed=embed)
+            async with get_rest_semaphore():
+                support_user = await get_cached_user(interaction.client, int(support_user_id))
+                await support_user.send(embed=embed)
 
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "✅ Sua mensagem foi enviada com sucesso para o suporte! Obrigado pelo feedback.",
                 ephemeral=True
             )
 
-            log_command("SUPORTE", interaction.user, "/suporte", f"Mensagem enviada: {title}")
+            log_command("SUPORTE", interaction.user, "/suporte", "Mensagem enviada: %s", title)
 
         except discord.NotFound:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "⚠️ Não foi possível encontrar o usuário de suporte. Por favor, informe o administrador do sistema.",
                 ephemeral=True
             )
-            log_command("ERRO", interaction.user, "/suporte", f"Usuário de suporte não encontrado: {support_user_id}")
+            log_command("ERRO", interaction.user, "/suporte", "Usuário de suporte não encontrado: %s", support_user_id)
         except discord.Forbidden:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "⚠️ O bot não tem permissão para enviar mensagens diretas ao usuário de suporte.",
                 ephemeral=True
             )
             log_command("ERRO", interaction.user, "/suporte", "Permissão negada para enviar DM ao suporte")
         except Exception as e:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ Ocorreu um erro ao enviar a mensagem: {str(e)}",
                 ephemeral=True
             )
-            log_command("ERRO", interaction.user, "/suporte", f"Erro ao enviar mensagem: {str(e)}")
\ No newline at end of file
+            log_command("ERRO", interaction.user, "/suporte", "Erro ao enviar mensagem: %s", e)
\ No newline at end of file
@@ -7,8 +7,10 @@ import discord
 from discord.ext import tasks, commands
 from discord import app_commands
 
+from src.bot.embeds import build_pending_embed
 from src.storage.daily import get_missing_updates
-from src.utils.config import get_env, get_br_time, to_br_timezone, BRAZIL_TIMEZONE, log_command
+from src.utils.config import get_env, get_br_time, to_br_timezone, log_command, BRAZIL_TIMEZONE
+from src.utils.rate_limit import send_reminder
 from src.storage.users import check_user_is_po
 from src.storage.feature_toggle import is_feature_enabled
 from src.storage.ignored_dates import should_ignore_date, get_all_ignored_dates
@@ -21,27 +23,55 @@ class ScheduledTasks(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+
+        daily_channel_id = get_env("DAILY_CHANNEL_ID")
+        try:
+            self.daily_channel_id = int(daily_channel_id) if daily_channel_id else None
+        except ValueError:
+            logger.warning(f"DAILY_CHANNEL_ID configurado com valor inválido: {daily_channel_id}")
+            self.daily_channel_id = None
+        self._daily_channel: Optional[discord.abc.GuildChannel] = None
+        self._fallback_channel_id: Optional[int] = None
+
         self.daily_reminder.start()
 
+    async def _get_daily_channel(self) -> Optional[discord.abc.GuildChannel]:
+        """
+        Obtém o canal de atualizações diárias, consultando a API apenas na primeira vez.
+
+        Returns:
+            O canal configurado em DAILY_CHANNEL_ID ou None se não estiver configurado.
+
+        Raises:
+            discord.NotFound, discord.Forbidden: Se o canal não puder ser obtido.
+        """
+        if self.daily_channel_id is None:
+            return None
+
+        if self._daily_channel is None:
+            self._daily_channel = (self.bot.get_channel(self.daily_channel_id)
+                                   or await self.bot.fetch_channel(self.daily_channel_id))
+        return self._daily_channel
+
     async def log_configured_channels(self):
         """Loga informações sobre os canais configurados na inicialização do bot."""
         logger.info("==== Verificando canais configurados ====")
 
-        daily_channel_id = get_env("DAILY_CHANNEL_ID")
-        if daily_channel_id:
+        if self.daily_channel_id:
             try:
-                daily_channel = await self.bot.fetch_channel(int(daily_channel_id))
+                daily_channel = await self._get_daily_channel()
                 logger.info(f"Canal para atualizações diárias configurado: #{daily_channel.name} (ID: {daily_channel.id}) no servidor {daily_channel.guild.name}")
-            except (discord.NotFound, discord.Forbidden, ValueError) as e:
+            except (discord.NotFound, discord.Forbidden) as e:
                 logger.error(f"Erro ao obter canal para atualizações diárias: {str(e)}")
-                logger.info(f"DAILY_CHANNEL_ID configurado com valor inválido ou inacessível: {daily_channel_id}")
+                logger.info(f"DAILY_CHANNEL_ID configurado com valor inválido ou inacessível: {self.daily_channel_id}")
         else:
             logger.warning("DAILY_CHANNEL_ID não está configurado. O bot usará um canal alternativo para os lembretes.")
 
         time_tracking_channel_id = get_env("TIME_TRACKING_CHANNEL_ID")
         if time_tracking_channel_id:
             try:
-                time_channel = await self.bot.fetch_channel(int(time_tracking_channel_id))
+                time_channel_id = int(time_tracking_channel_id)
+                time_channel = self.bot.get_channel(time_channel_id) or await self.bot.fetch_channel(time_channel_id)
                 logger.info(f"Canal para time tracking configurado: #{time_channel.name} (ID: {time_channel.id}) no servidor {time_channel.guild.name}")
             except (discord.NotFound, discord.Forbidden, ValueError) as e:
                 logger.error(f"Erro ao obter canal para time tracking: {str(e)}")
@@ -117,74 +147,58 @@ class ScheduledTasks(commands.Cog):
 
             logger.info(f"Enviando lembretes para {len(missing_users)} usuários")
 
-            daily_channel_id = get_env("DAILY_CHANNEL_ID")
             daily_channel = None
 
-            if daily_channel_id:
+            if self.daily_channel_id:
                 try:
-                    daily_channel = await self.bot.fetch_channel(int(daily_channel_id))
+                    daily_channel = await self._get_daily_channel()
                     logger.info(f"Canal para atualizações diárias encontrado: {daily_channel.name}")
-                except (discord.NotFound, discord.Forbidden, ValueError) as e:
+                except (discord.NotFound, discord.Forbidden) as e:
                     logger.error(f"Erro ao obter canal para atualizações diárias: {str(e)}")
 
             if not daily_channel:
                 logger.info("Canal específico para atualizações diárias não configurado ou não encontrado")
 
-            pending_by_date: Dict[str, List[discord.User]] = {}
-            processed_users = []
-
-            for user_id in missing_users:
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    processed_users.append(user)
-
-                    embed = discord.Embed(
-                        title="🔔 Lembrete: Atualização Diária Pendente",
-                        description="Você ainda não enviou sua atualização diária de ontem. Por favor, use o comando `/daily` para informar o que você fez.",
-                        color=discord.Color.yellow()
-                    )
-
-                    yesterday = get_br_time() - timedelta(days=1)
-                    yesterday_str = yesterday.strftime("%d/%m/%Y")
-                    yesterday_db = yesterday.strftime("%Y-%m-%d")
-
-                    if daily_channel:
-                        embed.add_field(
-                            name="Onde enviar?",
-                            value=f"Use o comando `/daily` no canal {daily_channel.mention} e descreva o que você fez ontem.",
-                            inline=False
-                        )
-                    else:
-                        embed.add_field(
-                            name="Como enviar?",
-                            value="Use o comando `/daily` no servidor e descreva o que você fez ontem.",
-                            inline=False
-                        )
+            yesterday_str = yesterday.strftime("%d/%m/%Y")
+            yesterday_db = yesterday.strftime("%Y-%m-%d")
 
-                    embed.set_footer(text=f"Atualização pendente para: {yesterday_str}")
-
-                    await user.send(embed=embed)
+            embed = discord.Embed(
+                title="🔔 Lembrete: Atualização Diária Pendente",
+                description="Você ainda não enviou sua atualização diária de ontem. Por favor, use o comando `/daily` para informar o que você fez.",
+                color=discord.Color.yellow()
+            )
 
-                    if yesterday_db not in pending_by_date:
-                        pending_by_date[yesterday_db] = []
-                    pending_by_date[yesterday_db].append(user)
+            if daily_channel:
+                embed.add_field(
+                    name="Onde enviar?",
+                    value=f"Use o comando `/daily` no canal {daily_channel.mention} e descreva o que você fez ontem.",
+                    inline=False
+                )
+            else:
+                embed.add_field(
+                    name="Como enviar?",
+                    value="Use o comando `/daily` no servidor e descreva o que você fez ontem.",
+                    inline=False
+                )
 
-                    logger.info(f"Lembrete enviado para o usuário {user_id}")
-                    await asyncio.sleep(1)
+            embed.set_footer(text=f"Atualização pendente para: {yesterday_str}")
 
-                except discord.HTTPException as e:
-                    logger.error(f"Erro ao enviar lembrete para o usuário {user_id}: {str(e)}")
-                except Exception as e:
-                    logger.error(f"Erro inesperado ao processar lembrete para o usuário {user_id}: {str(e)}")
+            user_ids = dict.fromkeys(int(user_id) for user_id in missing_users)
+            results = await asyncio.gather(*(send_reminder(self.bot, user_id, embed, "lembrete") for user_id in user_ids))
+            processed_users = [user for user in results if user is not None]
+            pending_by_date: Dict[str, List[discord.User]] = {yesterday_db: processed_users} if processed_users else {}
 
             if processed_users and (daily_channel or self.bot.guilds):
-                await self._send_public_reminder(daily_channel, pending_by_date)
+                await self._send_public_reminder(daily_channel, pending_by_date, br_time)
 
         except Exception as e:
-            logger.error(f"Erro ao executar tarefa de lembretes: {str(e)}")
+            logger.exception(f"Erro ao executar tarefa de lembretes: {str(e)}")
 
-    async def _send_public_reminder(self, daily_channel: Optional[discord.TextChannel], pending_by_date: Dict[str, List[discord.User]]):
+    async def _send_public_reminder(self, daily_channel: Optional[discord.TextChannel], pending_by_date: Dict[str, List[discord.User]], now_br: datetime):
         """Envia um lembrete público no canal designado listando todos os usuários pendentes."""
+        if not pending_by_date:
+            return
+
         try:
             channel = daily_channel
 
@@ -193,6 +207,12 @@ class ScheduledTasks(commands.Cog):
             else:
                 logger.info("Nenhum canal específico configurado para daily updates, buscando canal alternativo...")
 
+            if not channel and self._fallback_channel_id is not None:
+                cached_channel = self.bot.get_channel(self._fallback_channel_id)
+                if cached_channel and cached_channel.permissions_for(cached_channel.guild.me).send_messages:
+                    channel = cached_channel
+                    logger.info(f"Reutilizando canal alternativo: #{channel.name} (ID: {channel.id})")
+
             if not channel:
                 for guild in self.bot.guilds:
                     logger.info(f"Procurando canal apropriado no servidor: {guild.name} (ID: {guild.id})")
@@ -211,31 +231,23 @@ class ScheduledTasks(commands.Cog):
                         if channel:
                             break
 
+                if channel:
+                    self._fallback_channel_id = channel.id
+
             if not channel:
                 logger.error("Não foi possível encontrar um canal para enviar o lembrete público")
                 return
 
             logger.info(f"Canal final escolhido para envio do lembrete: #{channel.name} (ID: {channel.id}) no servidor {channel.guild.name}")
 
-            embed = discord.Embed(
-                title="📢 Lembretes de Atualizações Diárias Pendentes",
-                description="Os seguintes membros da equipe estão com atualizações diárias pendentes:",
-                color=discord.Color.gold()
+            embed = build_pending_embed(
+                "📢 Lembretes de Atualizações Diárias Pendentes",
+                "Os seguintes membros da equipe estão com atualizações diárias pendentes:",
+                discord.Color.gold(),
+                pending_by_date,
+                f"Horário de Brasília: {now_br.strftime('%d/%m/%Y %H:%M:%S')}"
             )
 
-            for date_str, users in pending_by_date.items():
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                date_obj = date_obj.replace(tzinfo=BRAZIL_TIMEZONE)
-                formatted_date = date_obj.strftime("%d/%m/%Y")
-
-                user_list = "\n".join([f"• {user.mention}" for user in users])
-
-                embed.add_field(
-                    name=f"📅 Dia {formatted_date}",
-                    value=user_list if user_list else "Nenhum usuário pendente.",
-                    inline=False
-                )
-
             daily_channel_mention = f"este canal ({channel.mention})" if channel == daily_channel else channel.mention
             if daily_channel:
                 embed.add_field(
@@ -250,9 +262,6 @@ class ScheduledTasks(commands.Cog):
                     inline=False
                 )
 
-            current_time_br = get_br_time().strftime("%d/%m/%Y %H:%M:%S")
-            embed.set_footer(text=f"Horário de Brasília: {current_time_br}")
-
             await channel.send(embed=embed)
             logger.info(f"Anúncio público de lembretes enviado no canal {channel.name}")
 
@@ -262,65 +271,49 @@ class ScheduledTasks(commands.Cog):
     async def _process_management_reminder(self, missing_users: List[str], requester: discord.User) -> Dict[str, List[discord.User]]:
         """Processa uma cobrança iniciada pela gerência, enviando mensagens privadas."""
         pending_by_date: Dict[str, List[discord.User]] = {}
-        processed_users = []
 
-        for user_id in missing_users:
-            try:
-                user = await self.bot.fetch_user(int(user_id))
-                processed_users.append(user)
+        now_br = get_br_time()
+        yesterday = now_br - timedelta(days=1)
+        yesterday_db = yesterday.strftime("%Y-%m-%d")
 
-                embed = discord.Embed(
-                    title="⚠️ Cobrança: Atualizações Diárias Pendentes",
-                    description=f"A equipe de gerência de projetos ({requester.mention}) notou que você está com atualizações diárias pendentes.",
-                    color=discord.Color.red()
-                )
-
-                yesterday = get_br_time() - timedelta(days=1)
-                yesterday_db = yesterday.strftime("%Y-%m-%d")
-
-                daily_channel_id = get_env("DAILY_CHANNEL_ID")
-                daily_channel = None
-
-                if daily_channel_id:
-                    try:
-                        daily_channel = await self.bot.fetch_channel(int(daily_channel_id))
-                    except (discord.NotFound, discord.Forbidden):
-                        pass
-
-                if daily_channel:
-                    embed.add_field(
-                        name="⏰ Solicitação Urgente",
-                        value=f"Por favor, use o comando `/daily` no canal {daily_channel.mention} para atualizar seu status o mais rápido possível.",
-                        inline=False
-                    )
-                else:
-                    embed.add_field(
-                        name="⏰ Solicitação Urgente",
-                        value="Por favor, use o comando `/daily` para atualizar seu status o mais rápido possível.",
-                        inline=False
-                    )
-
-                embed.add_field(
-                    name="📝 Lembrete",
-                    value="Manter suas atualizações diárias em dia é essencial para o acompanhamento do projeto pela equipe de gerência.",
-                    inline=False
-                )
-
-                embed.set_footer(text=f"Cobrança realizada em: {get_br_time().strftime('%d/%m/%Y %H:%M:%S')}")
-
-                await user.send(embed=embed)
+        daily_channel = None
+        try:
+            daily_channel = await self._get_daily_channel()
+        except (discord.NotFound, discord.Forbidden):
+            pass
+
+        embed = discord.Embed(
+            title="⚠️ Cobrança: Atualizações Diárias Pendentes",
+            description=f"A equipe de gerência de projetos ({requester.mention}) notou que você está com atualizações diárias pendentes.",
+            color=discord.Color.red()
+        )
+
+        if daily_channel:
+            embed.add_field(
+                name="⏰ Solicitação Urgente",
+                value=f"Por favor, use o comando `/daily` no canal {daily_channel.mention} para atualizar seu status o mais rápido possível.",
+                inline=False
+            )
+        else:
+            embed.add_field(
+                name="⏰ Solicitação Urgente",
+                value="Por favor, use o comando `/daily` para atualizar seu status o mais rápido possível.",
+                inline=False
+            )
 
-                if yesterday_db not in pending_by_date:
-                    pending_by_date[yesterday_db] = []
-                pending_by_date[yesterday_db].append(user)
+        embed.add_field(
+            name="📝 Lembrete",
+            value="Manter suas atualizações diárias em dia é essencial para o acompanhamento do projeto pela equipe de gerência.",
+            inline=False
+        )
 
-                logger.info(f"Cobrança gerencial enviada para o usuário {user_id}")
-                await asyncio.sleep(1)
+        embed.set_footer(text=f"Cobrança realizada em: {now_br.strftime('%d/%m/%Y %H:%M:%S')}")
 
-            except discord.HTTPException as e:
-                logger.error(f"Erro ao enviar cobrança para o usuário {user_id}: {str(e)}")
-            except Exception as e:
-                logger.error(f"Erro inesperado ao processar cobrança para o usuário {user_id}: {str(e)}")
+        user_ids = dict.fromkeys(int(user_id) for user_id in missing_users)
+        results = await asyncio.gather(*(send_reminder(self.bot, user_id, embed, "cobrança") for user_id in user_ids))
+        processed_users = [user for user in results if user is not None]
+        if processed_users:
+            pending_by_date[yesterday_db] = processed_users
 
         return pending_by_date
 
@@ -334,15 +327,12 @@ class ScheduledTasks(commands.Cog):
         reminder_time_str = get_env("DAILY_REMINDER_TIME", "10:00")
         try:
             hour, minute = map(int, reminder_time_str.split(":"))
-
-            utc_hour = (hour + 3) % 24
-            reminder_time = time(utc_hour, minute)
+            reminder_time = time(hour, minute, tzinfo=BRAZIL_TIMEZONE)
 
             self.daily_reminder.change_interval(time=reminder_time)
             logger.info(f"Tarefa de lembretes configurada para executar diariamente às {reminder_time_str} (Horário de Brasília)")
-            logger.info(f"Convertido para {utc_hour}:{minute:02d} UTC")
         except (ValueError, AttributeError) as e:
-            default_time = time(13, 0)
+            default_time = time(10, 0, tzinfo=BRAZIL_TIMEZONE)
             self.daily_reminder.change_interval(time=default_time)
             logger.error(f"Erro ao configurar horário do lembrete ({str(e)}). Usando o padrão: 10:00 (Horário de Brasília)")
 
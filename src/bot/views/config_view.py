@@ -3,37 +3,91 @@ from discord import ui
 from discord.ext import commands
 import logging
 from datetime import datetime
+from typing import Optional
 
-from src.utils.config import get_br_time, log_command
+from src.utils.config import get_br_time, log_command, format_date_for_display, ADMIN_ROLE_ID
+from src.utils.discord_cache import get_cached_user
 from src.storage.ignored_dates import get_all_ignored_dates
+from src.storage.users import get_user
 from src.bot.modals import DateConfigModal
 
 logger = logging.getLogger('team_analysis_bot')
 
+CONFIG_VIEW_TIMEOUT = 300
+
 class ConfigView(ui.View):
-    """View com botões para escolher configurações do bot."""
+    """
+    View com botões para escolher configurações do bot.
+
+    A view é persistente: os botões têm custom_id fixo e uma instância é registrada
+    na inicialização do bot, então continuam funcionando sem timeout e após reinícios.
+    Por isso a permissão de quem clica é verificada novamente a cada interação.
 
-    def __init__(self, bot: commands.Bot, funcionalidade: str):
-        super().__init__(timeout=300)
+    As instâncias enviadas pelo /config usam CONFIG_VIEW_TIMEOUT, para não acumular uma view
+    permanente por mensagem; quando expiram, os cliques passam a ser tratados pela instância
+    registrada na inicialização.
+    """
+
+    def __init__(self, bot: commands.Bot, funcionalidade: Optional[str] = None, timeout: Optional[float] = None):
+        super().__init__(timeout=timeout)
         self.bot = bot
         self.funcionalidade = funcionalidade
 
-    @ui.button(label="Configurar Datas Ignoradas", style=discord.ButtonStyle.primary, emoji="📅")
+    @property
+    def command(self) -> str:
+        """Comando registrado nos logs; a instância registrada na inicialização não conhece a funcionalidade."""
+        if self.funcionalidade:
+            return f"/config funcionalidade={self.funcionalidade}"
+        return "/config"
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """
+        Permite o uso dos botões apenas para administradores e Product Owners, como no /config.
+
+        Args:
+            interaction: A interação do Discord.
+
+        Returns:
+            bool: True se o usuário pode usar os botões, False caso contrário.
+        """
+        admin_role_id = ADMIN_ROLE_ID
+        has_permission = False
+
+        if admin_role_id == 0:
+            guild_permissions = getattr(interaction.user, "guild_permissions", None)
+            has_permission = bool(guild_permissions and guild_permissions.administrator)
+        else:
+            has_permission = any(role.id == admin_role_id for role in getattr(interaction.user, "roles", []))
+
+        user = get_user(str(interaction.user.id))
+        if user and user['role'] == 'po':
+            has_permission = True
+
+        if not has_permission:
+            await interaction.response.send_message(
+                "⚠️ Você não tem permissão para usar este comando. Apenas administradores e Product Owners podem configurar o bot.",
+                ephemeral=True
+            )
+            log_command("PERMISSÃO NEGADA", interaction.user, self.command)
+
+        return has_permission
+
+    @ui.button(label="Configurar Datas Ignoradas", style=discord.ButtonStyle.primary, emoji="📅", custom_id="config:ignored_dates")
     async def ignored_dates_button(self, interaction: discord.Interaction, button: ui.Button):
         """Botão para configurar datas ignoradas na cobrança de daily."""
         try:
             modal = DateConfigModal(self.bot)
             await interaction.response.send_modal(modal)
-            log_command("INFO", interaction.user, f"/config funcionalidade={self.funcionalidade}", "Modal de configuração de datas ignoradas aberto")
+            log_command("INFO", interaction.user, self.command, "Modal de configuração de datas ignoradas aberto")
         except Exception as e:
             logger.error(f"Erro ao abrir modal de configuração: {str(e)}")
             await interaction.response.send_message(
                 f"❌ Ocorreu um erro ao abrir o modal de configuração: {str(e)}",
                 ephemeral=True
             )
-            log_command("ERRO", interaction.user, f"/config funcionalidade={self.funcionalidade}", f"Erro ao abrir modal: {str(e)}")
+            log_command("ERRO", interaction.user, self.command, f"Erro ao abrir modal: {str(e)}")
 
-    @ui.button(label="Listar Datas Ignoradas", style=discord.ButtonStyle.secondary, emoji="📋")
+    @ui.button(label="Listar Datas Ignoradas", style=discord.ButtonStyle.secondary, emoji="📋", custom_id="config:list_ignored_dates")
     async def list_ignored_dates_button(self, interaction: discord.Interaction, button: ui.Button):
         """Botão para listar as datas ignoradas configuradas."""
         ignored_dates = get_all_ignored_dates()
@@ -53,21 +107,17 @@ class ConfigView(ui.View):
         )
 
         for date_entry in ignored_dates:
-            start_date = datetime.strptime(date_entry["start_date"], "%Y-%m-%d")
-            end_date = datetime.strptime(date_entry["end_date"], "%Y-%m-%d")
-            created_at = datetime.strptime(date_entry["created_at"], "%Y-%m-%d %H:%M:%S")
-
-            start_date_str = start_date.strftime("%d/%m/%Y")
-            end_date_str = end_date.strftime("%d/%m/%Y")
-            created_at_str = created_at.strftime("%d/%m/%Y %H:%M:%S")
+            start_date_str = format_date_for_display(date_entry["start_date"])
+            end_date_str = format_date_for_display(date_entry["end_date"])
+            created_at_str = datetime.fromisoformat(date_entry["created_at"]).strftime("%d/%m/%Y %H:%M:%S")
 
-            if start_date == end_date:
+            if date_entry["start_date"] == date_entry["end_date"]:
                 date_desc = f"📆 **{start_date_str}**"
             else:
                 date_desc = f"📆 De **{start_date_str}** até **{end_date_str}**"
 
             try:
-                creator_user = await self.bot.fetch_user(int(date_entry["created_by"]))
+                creator_user = await get_cached_user(self.bot, int(date_entry["created_by"]))
                 creator_name = creator_user.display_name
             except:
                 creator_name = f"Usuário {date_entry['created_by']}"
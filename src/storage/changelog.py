@@ -5,13 +5,13 @@ import os
 import yaml
 import logging
 import sqlite3
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple
 from datetime import datetime
 
 import discord
 
 from src.storage.database import get_connection
-from src.version import get_version
+from src.version import get_version, YAML_LOADER
 from src.utils.config import now_br
 
 logger = logging.getLogger('team_analysis_bot')
@@ -19,6 +19,50 @@ logger = logging.getLogger('team_analysis_bot')
 CHANGELOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'changelogs')
 os.makedirs(CHANGELOGS_DIR, exist_ok=True)
 
+_changelog_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_announced_versions: Optional[Set[str]] = None
+
+CHANGE_TYPE_ICONS = {
+    "adicionado": "✨",
+    "melhorado": "⚡",
+    "corrigido": "🐛",
+    "alterado": "🔄",
+    "removido": "🗑️",
+    "seguranca": "🔒",
+    "desenvolvimento": "⚙️"
+}
+
+CHANGE_TYPE_TITLES = {
+    "adicionado": "Adicionado",
+    "melhorado": "Melhorado",
+    "corrigido": "Corrigido",
+    "alterado": "Alterado",
+    "removido": "Removido",
+    "seguranca": "Segurança",
+    "desenvolvimento": "Desenvolvimento"
+}
+
+
+def _get_announced_versions() -> Set[str]:
+    """
+    Obtém as versões já anunciadas, consultando o banco apenas na primeira chamada.
+
+    Returns:
+        Set[str]: Versões registradas em changelog_announcements.
+    """
+    global _announced_versions
+
+    if _announced_versions is None:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT version FROM changelog_announcements")
+        _announced_versions = {row['version'] for row in cursor.fetchall()}
+
+        conn.close()
+
+    return _announced_versions
+
 
 def has_version_been_announced(version: str) -> bool:
     """
@@ -30,18 +74,7 @@ def has_version_been_announced(version: str) -> bool:
     Returns:
         bool: True se a versão já foi anunciada, False caso contrário.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
-        "SELECT version FROM changelog_announcements WHERE version = ?",
-        (version,)
-    )
-
-    result = cursor.fetchone()
-    conn.close()
-
-    return result is not None
+    return version in _get_announced_versions()
 
 
 def mark_version_as_announced(version: str):
@@ -63,6 +96,7 @@ def mark_version_as_announced(version: str):
 
     conn.commit()
     conn.close()
+    _get_announced_versions().add(version)
     logger.info(f"Versão {version} marcada como anunciada em {current_time}")
 
 
@@ -70,6 +104,9 @@ def get_changelog_for_version(version: str) -> Optional[Dict[str, Any]]:
     """
     Obtém o changelog para uma versão específica.
 
+    O conteúdo é mantido em cache e só é relido quando a data de modificação do arquivo muda;
+    o dicionário retornado é compartilhado e não deve ser alterado.
+
     Args:
         version: Versão para obter o changelog.
 
@@ -79,13 +116,21 @@ def get_changelog_for_version(version: str) -> Optional[Dict[str, Any]]:
     try:
         changelog_file = os.path.join(CHANGELOGS_DIR, f"{version}.yaml")
 
-        if not os.path.exists(changelog_file):
+        try:
+            mtime = os.path.getmtime(changelog_file)
+        except OSError:
             logger.warning(f"Arquivo de changelog para versão {version} não encontrado: {changelog_file}")
             return None
 
+        cached = _changelog_cache.get(version)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
         with open(changelog_file, "r", encoding="utf-8") as f:
-            changelog_data = yaml.safe_load(f)
-            return changelog_data
+            changelog_data = yaml.load(f, Loader=YAML_LOADER)
+
+        _changelog_cache[version] = (mtime, changelog_data)
+        return changelog_data
     except Exception as e:
         logger.error(f"Erro ao carregar changelog para versão {version}: {str(e)}")
         return None
@@ -107,53 +152,32 @@ def create_changelog_embed(changelog: Dict[str, Any]) -> discord.Embed:
         color=discord.Color.blue()
     )
 
-    type_icons = {
-        "adicionado": "✨",
-        "melhorado": "⚡",
-        "corrigido": "🐛",
-        "alterado": "🔄",
-        "removido": "🗑️",
-        "seguranca": "🔒",
-        "desenvolvimento": "⚙️"
-    }
-
-    type_titles = {
-        "adicionado": "Adicionado",
-        "melhorado": "Melhorado",
-        "corrigido": "Corrigido",
-        "alterado": "Alterado",
-        "removido": "Removido",
-        "seguranca": "Segurança",
-        "desenvolvimento": "Desenvolvimento"
-    }
-
-    if "changes" in changelog:
-        changes = changelog["changes"]
-        for change_type, descriptions in changes.items():
-            if descriptions:
-                icon = type_icons.get(change_type, "•")
-                title = type_titles.get(change_type, change_type.title())
-
-                value = "\n".join([f"• {desc}" for desc in descriptions])
-
-                embed.add_field(
-                    name=f"{icon} {title}",
-                    value=value,
-                    inline=False
-                )
-
-    if "notes" in changelog and changelog["notes"]:
+    for change_type, descriptions in (changelog.get("changes") or {}).items():
+        if not descriptions:
+            continue
+
+        icon = CHANGE_TYPE_ICONS.get(change_type, "•")
+        title = CHANGE_TYPE_TITLES.get(change_type, change_type.title())
+
+        embed.add_field(
+            name=f"{icon} {title}",
+            value="\n".join(f"• {desc}" for desc in descriptions),
+            inline=False
+        )
+
+    notes = changelog.get("notes")
+    if notes:
         embed.add_field(
             name="📝 Notas",
-            value=changelog["notes"],
+            value=notes,
             inline=False
         )
 
-    if "contributors" in changelog and changelog["contributors"]:
-        contributors = ", ".join(changelog["contributors"])
+    contributors = changelog.get("contributors")
+    if contributors:
         embed.add_field(
             name="👥 Contribuidores",
-            value=contributors,
+            value=", ".join(contributors),
             inline=False
         )
 
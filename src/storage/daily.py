@@ -1,14 +1,17 @@
 import sqlite3
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 from src.storage.database import get_connection
-from src.storage.users import get_user, get_users_by_role
-from src.utils.config import get_br_time, BRAZIL_TIMEZONE
+from src.storage.users import get_user
+from src.utils.config import get_br_time, parse_ymd_date, BRAZIL_TIMEZONE
 
 logger = logging.getLogger('team_analysis_bot')
 
+# Dias a voltar a partir de hoje para chegar à sexta-feira quando ontem foi sábado (5) ou domingo (6)
+WEEKEND_DAYS_BACK = {5: 2, 6: 3}
+
 
 def submit_daily_update(user_id: str, content: str, report_date: Optional[str] = None) -> Tuple[bool, str]:
     """
@@ -26,41 +29,38 @@ def submit_daily_update(user_id: str, content: str, report_date: Optional[str] =
     if not user:
         return False, "Você não está registrado no sistema. Peça a um administrador para registrá-lo primeiro."
 
+    now_br = get_br_time()
+
     if not report_date:
-        yesterday = get_br_time() - timedelta(days=1)
+        yesterday = now_br - timedelta(days=1)
         report_date = yesterday.strftime("%Y-%m-%d")
 
-    try:
-        datetime.strptime(report_date, "%Y-%m-%d")
-    except ValueError:
+    if parse_ymd_date(report_date) is None:
         return False, f"Formato de data inválido: {report_date}. Use o formato YYYY-MM-DD."
 
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
+        now = now_br.isoformat()
+
         cursor.execute(
-            "SELECT * FROM daily_updates WHERE user_id = ? AND report_date = ?",
-            (user_id, report_date)
+            """
+            INSERT INTO daily_updates (user_id, report_date, content, submitted_at, last_updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, report_date) DO UPDATE SET
+                content = excluded.content,
+                last_updated_at = excluded.last_updated_at
+            RETURNING submitted_at
+            """,
+            (user_id, report_date, content, now, now)
         )
-        existing_report = cursor.fetchone()
-
-        now = get_br_time().isoformat()
+        submitted_at = cursor.fetchone()['submitted_at']
+        conn.commit()
 
-        if existing_report:
-            cursor.execute(
-                "UPDATE daily_updates SET content = ?, last_updated_at = ? WHERE id = ?",
-                (content, now, existing_report['id'])
-            )
-            conn.commit()
+        if submitted_at != now:
             return True, f"Atualização diária para {report_date} foi atualizada com sucesso."
-        else:
-            cursor.execute(
-                "INSERT INTO daily_updates (user_id, report_date, content, submitted_at, last_updated_at) VALUES (?, ?, ?, ?, ?)",
-                (user_id, report_date, content, now, now)
-            )
-            conn.commit()
-            return True, f"Atualização diária para {report_date} foi enviada com sucesso."
+        return True, f"Atualização diária para {report_date} foi enviada com sucesso."
 
     except sqlite3.Error as e:
         return False, f"Erro ao salvar atualização diária: {str(e)}"
@@ -69,7 +69,8 @@ def submit_daily_update(user_id: str, content: str, report_date: Optional[str] =
         conn.close()
 
 
-def get_user_daily_updates(user_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Dict[str, Any]]:
+def get_user_daily_updates(user_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           limit: Optional[int] = None) -> List[sqlite3.Row]:
     """
     Obtém as atualizações diárias de um usuário em um período.
 
@@ -77,9 +78,10 @@ def get_user_daily_updates(user_id: str, start_date: Optional[str] = None, end_d
         user_id (str): ID do usuário no Discord.
         start_date (Optional[str]): Data inicial no formato YYYY-MM-DD.
         end_date (Optional[str]): Data final no formato YYYY-MM-DD.
+        limit (Optional[int]): Quantidade máxima de atualizações retornadas, das mais recentes.
 
     Returns:
-        List[Dict[str, Any]]: Lista de atualizações diárias.
+        List[sqlite3.Row]: Lista de atualizações diárias (acesso aos campos por nome).
     """
     conn = get_connection()
     cursor = conn.cursor()
@@ -98,10 +100,12 @@ def get_user_daily_updates(user_id: str, start_date: Optional[str] = None, end_d
 
         query += " ORDER BY report_date DESC"
 
-        cursor.execute(query, params)
-        updates = cursor.fetchall()
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
 
-        return [dict(update) for update in updates]
+        cursor.execute(query, params)
+        return cursor.fetchall()
 
     except sqlite3.Error:
         return []
@@ -110,7 +114,7 @@ def get_user_daily_updates(user_id: str, start_date: Optional[str] = None, end_d
         conn.close()
 
 
-def get_all_daily_updates(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+def get_all_daily_updates(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, List[sqlite3.Row]]:
     """
     Obtém todas as atualizações diárias no período especificado, agrupadas por usuário.
 
@@ -119,7 +123,7 @@ def get_all_daily_updates(start_date: Optional[str] = None, end_date: Optional[s
         end_date (Optional[str]): Data final no formato YYYY-MM-DD.
 
     Returns:
-        Dict[str, List[Dict[str, Any]]]: Dicionário com IDs dos usuários como chaves e listas de atualizações como valores.
+        Dict[str, List[sqlite3.Row]]: Dicionário com IDs dos usuários como chaves e listas de atualizações como valores.
     """
     logger.debug(f"[DEBUG] get_all_daily_updates: Iniciando busca para período {start_date} a {end_date}")
 
@@ -155,17 +159,10 @@ def get_all_daily_updates(start_date: Optional[str] = None, end_date: Optional[s
 
         results = {}
         for update in all_updates:
-            user_id = update['user_id']
-            if user_id not in results:
-                results[user_id] = []
-
-            results[user_id].append(dict(update))
+            results.setdefault(update['user_id'], []).append(update)
 
         logger.debug(f"[DEBUG] get_all_daily_updates: Organizadas atualizações para {len(results)} usuários")
 
-        for user_id, updates in results.items():
-            logger.debug(f"[DEBUG] get_all_daily_updates: Usuário {user_id} tem {len(updates)} atualizações")
-
         return results
 
     except sqlite3.Error as e:
@@ -176,6 +173,97 @@ def get_all_daily_updates(start_date: Optional[str] = None, end_date: Optional[s
         conn.close()
 
 
+def get_daily_update_user_ids(start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[str]:
+    """
+    Obtém os IDs distintos dos usuários que enviaram atualizações no período especificado.
+
+    Args:
+        start_date (Optional[str]): Data inicial no formato YYYY-MM-DD.
+        end_date (Optional[str]): Data final no formato YYYY-MM-DD.
+
+    Returns:
+        List[str]: IDs dos usuários com pelo menos uma atualização no período.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        query = "SELECT DISTINCT user_id FROM daily_updates"
+        conditions = []
+        params = []
+
+        if start_date:
+            conditions.append("report_date >= ?")
+            params.append(start_date)
+
+        if end_date:
+            conditions.append("report_date <= ?")
+            params.append(end_date)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        cursor.execute(query, params)
+        return [row['user_id'] for row in cursor.fetchall()]
+
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao buscar usuários com atualizações diárias: {str(e)}")
+        return []
+
+    finally:
+        conn.close()
+
+
+def iter_all_daily_updates_flat(start_date: Optional[str] = None, end_date: Optional[str] = None) -> Iterator[sqlite3.Row]:
+    """
+    Percorre todas as atualizações diárias no período especificado direto do cursor,
+    já ordenadas por data (mais recente primeiro) e com os dados do usuário associados.
+
+    A conexão é aberta na primeira iteração e fechada quando o gerador termina,
+    portanto o gerador deve ser consumido na mesma thread em que começou.
+
+    Args:
+        start_date (Optional[str]): Data inicial no formato YYYY-MM-DD.
+        end_date (Optional[str]): Data final no formato YYYY-MM-DD.
+
+    Yields:
+        sqlite3.Row: Linha com os campos da tabela daily_updates acrescidos de
+        user_name, nickname e role (None se o usuário não estiver mais registrado).
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        query = """
+            SELECT d.*, u.user_name, u.nickname, u.role
+            FROM daily_updates d
+            LEFT JOIN users u ON u.user_id = d.user_id
+        """
+        conditions = []
+        params = []
+
+        if start_date:
+            conditions.append("d.report_date >= ?")
+            params.append(start_date)
+
+        if end_date:
+            conditions.append("d.report_date <= ?")
+            params.append(end_date)
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY d.report_date DESC, d.user_id"
+
+        yield from cursor.execute(query, params)
+
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao buscar atualizações diárias: {str(e)}")
+
+    finally:
+        conn.close()
+
+
 def get_missing_updates(for_date: Optional[str] = None) -> List[str]:
     """
     Obtém lista de IDs de usuários do tipo 'teammember' que não enviaram atualização para a data especificada.
@@ -189,46 +277,42 @@ def get_missing_updates(for_date: Optional[str] = None) -> List[str]:
         List[str]: Lista de IDs de usuários que não enviaram atualização.
     """
     if not for_date:
-        yesterday = get_br_time() - timedelta(days=1)
-        today_weekday = get_br_time().weekday()
+        now_br = get_br_time()
+        yesterday = now_br - timedelta(days=1)
         yesterday_weekday = yesterday.weekday()
 
-        logger.info(f"Verificando atualizações pendentes: hoje é dia {get_br_time().strftime('%Y-%m-%d')} (weekday={today_weekday}), verificando dia {yesterday.strftime('%Y-%m-%d')} (weekday={yesterday_weekday})")
+        logger.info(f"Verificando atualizações pendentes: hoje é dia {now_br.strftime('%Y-%m-%d')} (weekday={now_br.weekday()}), verificando dia {yesterday.strftime('%Y-%m-%d')} (weekday={yesterday_weekday})")
 
-        if yesterday.weekday() == 6:
-            yesterday = get_br_time() - timedelta(days=3)
-            logger.info(f"Dia anterior é domingo, verificando sexta-feira: {yesterday.strftime('%Y-%m-%d')}")
-        elif yesterday.weekday() == 5:
-            yesterday = get_br_time() - timedelta(days=2)
-            logger.info(f"Dia anterior é sábado, verificando sexta-feira: {yesterday.strftime('%Y-%m-%d')}")
+        days_back = WEEKEND_DAYS_BACK.get(yesterday_weekday)
+        if days_back:
+            yesterday = now_br - timedelta(days=days_back)
+            logger.info(f"Dia anterior é final de semana, verificando sexta-feira: {yesterday.strftime('%Y-%m-%d')}")
 
         for_date = yesterday.strftime("%Y-%m-%d")
-
-    check_date = datetime.strptime(for_date, "%Y-%m-%d")
-    if check_date.weekday() >= 5:
-        logger.info(f"Data {for_date} é um final de semana (weekday={check_date.weekday()}), retornando lista vazia")
-        return []
-
-    team_members = get_users_by_role("teammember")
-    team_member_ids = [tm['user_id'] for tm in team_members]
-
-    if not team_member_ids:
-        return []
+    else:
+        check_weekday = date.fromisoformat(for_date).weekday()
+        if check_weekday >= 5:
+            logger.info(f"Data {for_date} é um final de semana (weekday={check_weekday}), retornando lista vazia")
+            return []
 
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        placeholders = ','.join(['?'] * len(team_member_ids))
-        query = f"SELECT DISTINCT user_id FROM daily_updates WHERE report_date = ? AND user_id IN ({placeholders})"
-        params = [for_date] + team_member_ids
-
-        cursor.execute(query, params)
-        submitted_users = [row['user_id'] for row in cursor.fetchall()]
-
-        missing_users = [user_id for user_id in team_member_ids if user_id not in submitted_users]
-
-        return missing_users
+        cursor.execute(
+            """
+            SELECT u.user_id
+            FROM users u
+            WHERE u.role = 'teammember'
+              AND NOT EXISTS (
+                  SELECT 1 FROM daily_updates d
+                  WHERE d.user_id = u.user_id AND d.report_date = ?
+              )
+            ORDER BY u.id
+            """,
+            (for_date,)
+        )
+        return [row['user_id'] for row in cursor.fetchall()]
 
     except sqlite3.Error:
         return []
@@ -283,11 +367,10 @@ def has_submitted_daily_update(user_id: str, report_date: Optional[str] = None)
 
     try:
         cursor.execute(
-            "SELECT COUNT(*) as count FROM daily_updates WHERE user_id = ? AND report_date = ?",
+            "SELECT 1 FROM daily_updates WHERE user_id = ? AND report_date = ? LIMIT 1",
             (user_id, report_date)
         )
-        result = cursor.fetchone()
-        return result and result['count'] > 0
+        return cursor.fetchone() is not None
 
     except sqlite3.Error:
         return False
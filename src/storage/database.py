@@ -1,4 +1,5 @@
 import os
+import queue
 import sqlite3
 from pathlib import Path
 
@@ -7,16 +8,69 @@ DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__)
 
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
+CONNECTION_POOL_SIZE = 4
+STATEMENT_CACHE_SIZE = 256
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+WARMUP_TABLES = ("daily_updates", "users", "ignored_dates", "feature_toggles", "changelog_announcements")
+
+
+class PooledConnection(sqlite3.Connection):
+    """Conexão SQLite que, ao ser fechada, volta para o pool em vez de ser encerrada."""
+
+    _in_pool = False
+
+    def close(self):
+        """Desfaz transações pendentes e devolve a conexão ao pool (ou a encerra se o pool estiver cheio)."""
+        if self._in_pool:
+            return
+
+        if self.in_transaction:
+            self.rollback()
+
+        try:
+            _pool.put_nowait(self)
+            self._in_pool = True
+        except queue.Full:
+            super().close()
+
+
+_pool: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue(maxsize=CONNECTION_POOL_SIZE)
+
+
+def _create_connection() -> PooledConnection:
+    """Abre uma nova conexão com o banco de dados e aplica os PRAGMAs de desempenho."""
+    conn = sqlite3.connect(DB_PATH, factory=PooledConnection, check_same_thread=False,
+                           cached_statements=STATEMENT_CACHE_SIZE)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    conn.row_factory = sqlite3.Row
+    return conn
+
 
 def get_connection():
     """
     Obtém uma conexão com o banco de dados.
 
+    As conexões são reaproveitadas de um pool de até CONNECTION_POOL_SIZE conexões abertas;
+    chamar close() devolve a conexão ao pool.
+
     Returns:
         sqlite3.Connection: Conexão com o banco de dados.
     """
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    try:
+        conn = _pool.get_nowait()
+        conn._in_pool = False
+    except queue.Empty:
+        conn = _create_connection()
+
     return conn
 
 
@@ -50,9 +104,8 @@ def initialize_database():
     )
     ''')
 
-    cursor.execute("PRAGMA table_info(users)")
-    columns = [column[1] for column in cursor.fetchall()]
-    if 'nickname' not in columns:
+    cursor.execute("SELECT 1 FROM pragma_table_info('users') WHERE name = 'nickname'")
+    if cursor.fetchone() is None:
         cursor.execute('ALTER TABLE users ADD COLUMN nickname TEXT')
 
     cursor.execute('''
@@ -67,6 +120,27 @@ def initialize_database():
     )
     ''')
 
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_daily_updates_report_date ON daily_updates(report_date)')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS ignored_dates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_date TEXT NOT NULL,
+        end_date TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        created_by TEXT NOT NULL
+    )
+    ''')
+
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ignored_dates_range ON ignored_dates(start_date, end_date)')
+
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS feature_toggles (
+        name TEXT PRIMARY KEY,
+        enabled INTEGER NOT NULL  -- 1 para ativada, 0 para desativada
+    )
+    ''')
+
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS changelog_announcements (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -76,6 +150,14 @@ def initialize_database():
     ''')
 
     conn.commit()
+
+    cursor.execute("PRAGMA optimize")
+
+    # Lê as tabelas mais usadas uma vez para que a primeira consulta real não pague leituras a frio do disco
+    for table in WARMUP_TABLES:
+        cursor.execute(f"SELECT count(*) FROM {table}")
+        cursor.fetchone()
+
     conn.close()
 
 
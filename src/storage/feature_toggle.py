@@ -2,13 +2,18 @@
 Módulo de controle de funcionalidades para Team Analysis Discord Bot.
 """
 import json
+import logging
 import os
+import sqlite3
+import time
 from typing import Dict, Optional
 
-FEATURE_TOGGLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                                  "data", "feature_toggles.json")
+from src.storage.database import get_connection
 
-os.makedirs(os.path.dirname(FEATURE_TOGGLE_FILE), exist_ok=True)
+logger = logging.getLogger('team_analysis_bot')
+
+LEGACY_FEATURE_TOGGLE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+                                          "data", "feature_toggles.json")
 
 DEFAULT_FEATURES = {
     "ponto": False,
@@ -16,68 +21,132 @@ DEFAULT_FEATURES = {
     "daily_collection": True,
 }
 
+FEATURE_CACHE_TTL = 5.0
 
-def load_feature_toggles() -> Dict[str, bool]:
+_cached_features: Optional[Dict[str, bool]] = None
+_cached_at = 0.0
+
+
+def _initialize_feature_toggles():
     """
-    Carrega as configurações de funcionalidades do arquivo de configuração.
+    Popula a tabela feature_toggles com os valores padrão das funcionalidades ainda não cadastradas.
 
-    Returns:
-        Dict[str, bool]: Dicionário contendo nomes das funcionalidades e seus status.
+    Se existir o antigo arquivo feature_toggles.json, seus valores são migrados para o banco
+    (prevalecendo sobre os padrões) e o arquivo é removido.
     """
-    if not os.path.exists(FEATURE_TOGGLE_FILE):
-        save_feature_toggles(DEFAULT_FEATURES)
-        return DEFAULT_FEATURES.copy()
+    legacy_features = {}
+    if os.path.exists(LEGACY_FEATURE_TOGGLE_FILE):
+        try:
+            with open(LEGACY_FEATURE_TOGGLE_FILE, 'r', encoding='utf-8') as f:
+                legacy_features = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(f"Erro ao ler arquivo de funcionalidades para migração: {e}")
+
+    conn = get_connection()
+    cursor = conn.cursor()
 
     try:
-        with open(FEATURE_TOGGLE_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return DEFAULT_FEATURES.copy()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO feature_toggles (name, enabled) VALUES (?, ?)",
+            [(name, int(bool(enabled))) for name, enabled in legacy_features.items()]
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO feature_toggles (name, enabled) VALUES (?, ?)",
+            [(name, int(enabled)) for name, enabled in DEFAULT_FEATURES.items()]
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao inicializar funcionalidades: {e}")
+        return
+    finally:
+        conn.close()
+
+    if legacy_features:
+        os.remove(LEGACY_FEATURE_TOGGLE_FILE)
+        logger.info(f"Funcionalidades migradas de {LEGACY_FEATURE_TOGGLE_FILE} para o banco de dados")
 
 
-def save_feature_toggles(features: Dict[str, bool]) -> None:
+def load_feature_toggles() -> Dict[str, bool]:
     """
-    Salva as configurações de funcionalidades no arquivo de configuração.
+    Carrega as configurações de funcionalidades do banco de dados.
 
-    Args:
-        features (Dict[str, bool]): Dicionário contendo nomes das funcionalidades e seus status.
+    Returns:
+        Dict[str, bool]: Dicionário contendo nomes das funcionalidades e seus status.
     """
-    os.makedirs(os.path.dirname(FEATURE_TOGGLE_FILE), exist_ok=True)
-    with open(FEATURE_TOGGLE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(features, f, indent=4)
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT name, enabled FROM feature_toggles")
+        return {row['name']: bool(row['enabled']) for row in cursor.fetchall()}
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao carregar funcionalidades: {e}")
+        return DEFAULT_FEATURES.copy()
+    finally:
+        conn.close()
 
 
-def is_feature_enabled(feature_name: str) -> bool:
+def is_feature_enabled(feature_name: str, ttl: float = FEATURE_CACHE_TTL) -> bool:
     """
     Verifica se uma funcionalidade específica está ativada.
 
+    O banco é consultado no máximo uma vez a cada `ttl` segundos; alterações feitas por
+    toggle_feature atualizam o cache na hora.
+
     Args:
         feature_name (str): Nome da funcionalidade a verificar.
+        ttl (float): Tempo em segundos durante o qual o último status lido é reutilizado.
 
     Returns:
         bool: True se a funcionalidade estiver ativada, False caso contrário.
     """
-    features = load_feature_toggles()
-    return features.get(feature_name, False)
+    global _cached_features, _cached_at
+
+    now = time.monotonic()
+    if _cached_features is None or now - _cached_at >= ttl:
+        _cached_features = load_feature_toggles()
+        _cached_at = now
 
+    return _cached_features.get(feature_name, False)
 
-def toggle_feature(feature_name: str) -> bool:
+
+def toggle_feature(feature_name: str) -> Optional[bool]:
     """
     Alterna uma funcionalidade entre ativada e desativada.
 
+    Uma funcionalidade ainda não cadastrada é considerada desativada e passa a ficar ativada.
+
     Args:
         feature_name (str): Nome da funcionalidade a alternar.
 
     Returns:
-        bool: O novo status da funcionalidade (True para ativada, False para desativada).
+        Optional[bool]: O novo status da funcionalidade (True para ativada, False para desativada),
+        ou None se ocorrer um erro no banco e a funcionalidade não for alterada.
     """
-    features = load_feature_toggles()
-
-    if feature_name not in features:
-        features[feature_name] = False
+    conn = get_connection()
+    cursor = conn.cursor()
 
-    features[feature_name] = not features[feature_name]
-
-    save_feature_toggles(features)
-
-    return features[feature_name]
\ No newline at end of file
+    try:
+        cursor.execute(
+            """
+            INSERT INTO feature_toggles (name, enabled) VALUES (?, 1)
+            ON CONFLICT(name) DO UPDATE SET enabled = NOT enabled
+            RETURNING enabled
+            """,
+            (feature_name,)
+        )
+        enabled = bool(cursor.fetchone()['enabled'])
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao alternar funcionalidade {feature_name}: {e}")
+        return None
+    finally:
+        conn.close()
+
+    if _cached_features is not None:
+        _cached_features[feature_name] = enabled
+
+    return enabled
+
+
+_initialize_feature_toggles()
@@ -1,37 +1,22 @@
 """Módulo para gerenciar configurações de datas ignoradas para cobrança de daily."""
 
+import bisect
 import json
+import re
 import sqlite3
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple, Union
+from typing import List, Dict, Optional, Tuple
 
 from src.storage.database import get_connection
-from src.utils.config import get_br_time, parse_date_string
+from src.utils.config import get_br_time, parse_date_string, parse_ymd_date
 
 logger = logging.getLogger('team_analysis_bot')
 
-def _create_tables_if_not_exists():
-    """Cria as tabelas necessárias no banco de dados se não existirem."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS ignored_dates (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            start_date TEXT NOT NULL,
-            end_date TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            created_by TEXT NOT NULL
-        )
-        ''')
+_DATE_TOKEN = r'\d{4}-\d{2}-\d{2}|\d{4}/\d{2}/\d{2}|\d{2}/\d{2}/\d{4}'
+DATE_CONFIG_PATTERN = re.compile(rf'^({_DATE_TOKEN})(?:\s*-\s*({_DATE_TOKEN}))?$')
 
-        conn.commit()
-    except sqlite3.Error as e:
-        logger.error(f"Erro ao criar tabelas de datas ignoradas: {e}")
-    finally:
-        conn.close()
+_ignored_periods: Optional[Tuple[List[int], List[int]]] = None
 
 def add_ignored_date(start_date: str, end_date: str, created_by: str) -> bool:
     """
@@ -45,12 +30,7 @@ def add_ignored_date(start_date: str, end_date: str, created_by: str) -> bool:
     Returns:
         bool: True se a operação foi bem-sucedida, False caso contrário
     """
-    _create_tables_if_not_exists()
-
-    try:
-        datetime.strptime(start_date, "%Y-%m-%d")
-        datetime.strptime(end_date, "%Y-%m-%d")
-    except ValueError:
+    if parse_ymd_date(start_date) is None or parse_ymd_date(end_date) is None:
         logger.error(f"Formato de data inválido: {start_date} ou {end_date}")
         return False
 
@@ -64,6 +44,7 @@ def add_ignored_date(start_date: str, end_date: str, created_by: str) -> bool:
             (start_date, end_date, now, created_by)
         )
         conn.commit()
+        _invalidate_ignored_periods()
         logger.info(f"Data ignorada adicionada: {start_date} a {end_date} por {created_by}")
         return True
     except sqlite3.Error as e:
@@ -88,6 +69,7 @@ def remove_ignored_date(date_id: int) -> bool:
     try:
         cursor.execute("DELETE FROM ignored_dates WHERE id = ?", (date_id,))
         conn.commit()
+        _invalidate_ignored_periods()
         if cursor.rowcount > 0:
             logger.info(f"Data ignorada removida: ID {date_id}")
             return True
@@ -100,22 +82,105 @@ def remove_ignored_date(date_id: int) -> bool:
     finally:
         conn.close()
 
-def get_all_ignored_dates() -> List[Dict[str, Union[int, str]]]:
+def replace_ignored_dates(date_pairs: List[Tuple[str, str]], created_by: str) -> int:
     """
-    Obtém todas as datas ignoradas configuradas.
+    Substitui todas as datas ignoradas pelos períodos informados em uma única transação.
+
+    Args:
+        date_pairs: Lista de tuplas (data_inicial, data_final) no formato YYYY-MM-DD
+        created_by: ID do usuário que criou a configuração
 
     Returns:
-        List[Dict]: Lista de dicionários com as informações das datas ignoradas
+        int: Quantidade de períodos cadastrados (0 se a operação falhar)
     """
-    _create_tables_if_not_exists()
+    now = get_br_time().strftime("%Y-%m-%d %H:%M:%S")
+    rows = []
+    for start_date, end_date in date_pairs:
+        if parse_ymd_date(start_date) is None or parse_ymd_date(end_date) is None:
+            logger.error(f"Formato de data inválido: {start_date} ou {end_date}")
+            continue
+        rows.append((start_date, end_date, now, created_by))
 
     conn = get_connection()
-    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("DELETE FROM ignored_dates")
+        removed_count = cursor.rowcount
+        cursor.executemany(
+            "INSERT INTO ignored_dates (start_date, end_date, created_at, created_by) VALUES (?, ?, ?, ?)",
+            rows
+        )
+        conn.commit()
+        _invalidate_ignored_periods()
+        logger.info(f"Datas ignoradas substituídas: {removed_count} removidas, {len(rows)} adicionadas por {created_by}")
+        return len(rows)
+    except sqlite3.Error as e:
+        conn.rollback()
+        logger.error(f"Erro ao substituir datas ignoradas: {e}")
+        return 0
+    finally:
+        conn.close()
+
+def _invalidate_ignored_periods():
+    """Descarta os períodos ignorados em cache para que sejam relidos do banco na próxima consulta."""
+    global _ignored_periods
+    _ignored_periods = None
+
+def _get_ignored_periods() -> Tuple[List[int], List[int]]:
+    """
+    Obtém os períodos ignorados, consultando o banco apenas quando o cache foi invalidado.
+
+    Períodos sobrepostos são unidos para que a busca em should_ignore_date possa ser binária,
+    e as datas são guardadas como ordinais (date.toordinal) para que a comparação seja entre inteiros.
+
+    Returns:
+        Tuple[List[int], List[int]]: Ordinais das datas iniciais e finais dos períodos, ordenados e sem sobreposição
+    """
+    global _ignored_periods
+
+    if _ignored_periods is None:
+        conn = get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT start_date, end_date FROM ignored_dates ORDER BY start_date")
+            rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Erro ao obter datas ignoradas: {e}")
+            return [], []
+        finally:
+            conn.close()
+
+        starts: List[int] = []
+        ends: List[int] = []
+        for row in rows:
+            start = parse_ymd_date(row['start_date'])
+            end = parse_ymd_date(row['end_date'])
+            if start is None or end is None:
+                continue
+
+            if starts and start.toordinal() <= ends[-1]:
+                ends[-1] = max(ends[-1], end.toordinal())
+            else:
+                starts.append(start.toordinal())
+                ends.append(end.toordinal())
+        _ignored_periods = (starts, ends)
+    return _ignored_periods
+
+def get_all_ignored_dates() -> List[sqlite3.Row]:
+    """
+    Obtém todas as datas ignoradas configuradas.
+
+    Returns:
+        List[sqlite3.Row]: Lista com as informações das datas ignoradas (acesso aos campos por nome)
+    """
+    conn = get_connection()
     cursor = conn.cursor()
 
     try:
         cursor.execute("SELECT * FROM ignored_dates ORDER BY start_date")
-        return [dict(row) for row in cursor.fetchall()]
+        return cursor.fetchall()
     except sqlite3.Error as e:
         logger.error(f"Erro ao obter datas ignoradas: {e}")
         return []
@@ -146,35 +211,34 @@ def parse_date_config(date_config: str) -> List[Tuple[str, str]]:
 
     logger.info(f"Processando configuração de datas: '{date_config}'")
 
-    parts = [p.strip() for p in date_config.split(',')]
+    parsed_dates: Dict[str, Optional[str]] = {}
 
-    for part in parts:
-        logger.info(f"Processando parte: '{part}'")
+    def parse_cached(date_str: str) -> Optional[str]:
+        if date_str not in parsed_dates:
+            parsed_dates[date_str] = parse_date_string(date_str)
+        return parsed_dates[date_str]
 
-        if '-' in part and part.count('-') >= 1:
-            try:
-                date_parts = part.split('-', 1)
+    for part in date_config.split(','):
+        part = part.strip()
+        logger.info(f"Processando parte: '{part}'")
 
-                if len(date_parts) == 2:
-                    start_date_str = date_parts[0].strip()
-                    end_date_str = date_parts[1].strip()
+        match = DATE_CONFIG_PATTERN.match(part)
+        if not match:
+            logger.warning(f"Formato não reconhecido: {part}")
+            continue
 
-                    start_date = parse_date_string(start_date_str)
-                    end_date = parse_date_string(end_date_str)
+        start_date = parse_cached(match[1])
+        end_date = parse_cached(match[2]) if match[2] else start_date
 
-                    if start_date and end_date:
-                        result.append((start_date, end_date))
-                        logger.info(f"Intervalo válido: {start_date} até {end_date}")
-                        continue
-            except Exception as e:
-                logger.warning(f"Erro ao processar possível intervalo de datas: {part} - {str(e)}")
+        if not start_date or not end_date:
+            logger.warning(f"Data inválida: {part}")
+            continue
 
-        standardized_date = parse_date_string(part)
-        if standardized_date:
-            result.append((standardized_date, standardized_date))
-            logger.info(f"Data única válida: {standardized_date}")
+        result.append((start_date, end_date))
+        if match[2]:
+            logger.info(f"Intervalo válido: {start_date} até {end_date}")
         else:
-            logger.warning(f"Formato não reconhecido: {part}")
+            logger.info(f"Data única válida: {start_date}")
 
     logger.info(f"Configuração processada com {len(result)} entradas válidas")
     return result
@@ -189,17 +253,11 @@ def should_ignore_date(date: datetime) -> bool:
     Returns:
         bool: True se a data deve ser ignorada, False caso contrário
     """
-    date_str = date.strftime("%Y-%m-%d")
-    ignored_dates = get_all_ignored_dates()
-
-    for ignored in ignored_dates:
-        start_date = ignored['start_date']
-        end_date = ignored['end_date']
-
-        if start_date <= date_str <= end_date:
-            return True
+    ordinal = date.toordinal()
+    starts, ends = _get_ignored_periods()
 
-    return False
+    index = bisect.bisect_right(starts, ordinal) - 1
+    return index >= 0 and ordinal <= ends[index]
 
 def clear_all_ignored_dates() -> bool:
     """
@@ -214,6 +272,7 @@ def clear_all_ignored_dates() -> bool:
     try:
         cursor.execute("DELETE FROM ignored_dates")
         conn.commit()
+        _invalidate_ignored_periods()
         logger.info(f"Todas as datas ignoradas foram removidas")
         return True
     except sqlite3.Error as e:
@@ -5,6 +5,8 @@ import logging
 
 from src.storage.database import get_connection
 
+_user_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+
 
 def register_user(user_id: str, role_or_name: str, role: str = None, registered_by: str = "system") -> Tuple[bool, str]:
     """
@@ -36,15 +38,14 @@ def register_user(user_id: str, role_or_name: str, role: str = None, registered_
     cursor = conn.cursor()
 
     try:
-        cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        existing_user = cursor.fetchone()
+        cursor.execute(
+            "UPDATE users SET role = ?, user_name = ?, registered_by = ? WHERE user_id = ?",
+            (role, user_name, registered_by, user_id)
+        )
 
-        if existing_user:
-            cursor.execute(
-                "UPDATE users SET role = ?, user_name = ?, registered_by = ? WHERE user_id = ?",
-                (role, user_name, registered_by, user_id)
-            )
+        if cursor.rowcount > 0:
             conn.commit()
+            _user_cache.pop(user_id, None)
             return True, f"Usuário atualizado para papel: {role_display_name(role)}"
 
         cursor.execute(
@@ -52,6 +53,7 @@ def register_user(user_id: str, role_or_name: str, role: str = None, registered_
             (user_id, user_name, role, registered_by)
         )
         conn.commit()
+        _user_cache.pop(user_id, None)
         return True, f"Usuário registrado com sucesso como: {role_display_name(role)}"
 
     except sqlite3.Error as e:
@@ -77,17 +79,16 @@ def update_user_nickname(user_id: str, nickname: str, updated_by: str) -> Tuple[
     cursor = conn.cursor()
 
     try:
-        cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        user = cursor.fetchone()
-
-        if not user:
-            return False, "Usuário não encontrado no sistema."
-
         cursor.execute(
             "UPDATE users SET nickname = ? WHERE user_id = ?",
             (nickname, user_id)
         )
+
+        if cursor.rowcount == 0:
+            return False, "Usuário não encontrado no sistema."
+
         conn.commit()
+        _user_cache.pop(user_id, None)
 
         return True, f"Apelido do usuário atualizado com sucesso para: {nickname}"
 
@@ -102,12 +103,19 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
     """
     Obtém informações de um usuário pelo ID.
 
+    O resultado fica em cache até que o usuário seja alterado por register_user,
+    update_user_nickname ou remove_user.
+
     Args:
         user_id (str): ID do usuário no Discord.
 
     Returns:
         Optional[Dict[str, Any]]: Informações do usuário ou None se não encontrado.
     """
+    if user_id in _user_cache:
+        cached = _user_cache[user_id]
+        return dict(cached) if cached is not None else None
+
     conn = get_connection()
     cursor = conn.cursor()
 
@@ -115,9 +123,8 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
         cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
         user = cursor.fetchone()
 
-        if user:
-            return dict(user)
-        return None
+        _user_cache[user_id] = dict(user) if user else None
+        return dict(user) if user else None
 
     except sqlite3.Error:
         return None
@@ -138,7 +145,7 @@ def get_users_by_role(role: str) -> List[Dict[str, Any]]:
     """
     logger = logging.getLogger('team_analysis_bot')
 
-    logger.debug(f"Iniciando busca de usuários com papel '{role}'")
+    logger.debug("Iniciando busca de usuários com papel '%s'", role)
 
     conn = get_connection()
     cursor = conn.cursor()
@@ -148,18 +155,18 @@ def get_users_by_role(role: str) -> List[Dict[str, Any]]:
             logger.debug("Buscando todos os usuários (all)")
             cursor.execute("SELECT * FROM users")
         else:
-            logger.debug(f"Buscando usuários com papel específico: {role}")
+            logger.debug("Buscando usuários com papel específico: %s", role)
             cursor.execute("SELECT * FROM users WHERE role = ?", (role,))
 
         users = cursor.fetchall()
 
         if users:
-            logger.debug(f"Encontrados {len(users)} usuários com papel '{role}'")
+            logger.debug("Encontrados %d usuários com papel '%s'", len(users), role)
         else:
-            logger.debug(f"Nenhum usuário encontrado com papel '{role}'")
+            logger.debug("Nenhum usuário encontrado com papel '%s'", role)
 
         result = [dict(user) for user in users]
-        logger.debug(f"Lista convertida para dicionários com {len(result)} itens")
+        logger.debug("Lista convertida para dicionários com %d itens", len(result))
 
         return result
 
@@ -192,12 +199,12 @@ def get_all_users() -> List[Dict[str, Any]]:
         users = cursor.fetchall()
 
         if users:
-            logger.debug(f"Encontrados {len(users)} usuários no total")
+            logger.debug("Encontrados %d usuários no total", len(users))
         else:
             logger.debug("Nenhum usuário encontrado no sistema")
 
         result = [dict(user) for user in users]
-        logger.debug(f"Lista convertida para dicionários com {len(result)} itens")
+        logger.debug("Lista convertida para dicionários com %d itens", len(result))
 
         return result
 
@@ -224,14 +231,13 @@ def remove_user(user_id: str) -> Tuple[bool, str]:
     cursor = conn.cursor()
 
     try:
-        cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        user = cursor.fetchone()
+        cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
 
-        if not user:
+        if cursor.rowcount == 0:
             return False, "Usuário não encontrado."
 
-        cursor.execute("DELETE FROM users WHERE user_id = ?", (user_id,))
         conn.commit()
+        _user_cache.pop(user_id, None)
 
         return True, f"Usuário removido com sucesso."
 
@@ -2,20 +2,25 @@
 Utilitários de configuração para Team Analysis Discord Bot.
 """
 import os
+import sys
 import json
+import asyncio
 import datetime
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional, Union
-import pytz
 import re
+from zoneinfo import ZoneInfo
 
 import discord
 
-BRAZIL_TIMEZONE = pytz.timezone('America/Sao_Paulo')
+BRAZIL_TIMEZONE = ZoneInfo('America/Sao_Paulo')
 
 DAILY_CHANNEL_ID = "DAILY_CHANNEL_ID"
-TIME_TRACKING_CHANNEL_ID = "TIME_TRACKING_CHANNEL_ID"
+_ENV_TIME_TRACKING_CHANNEL_ID = "TIME_TRACKING_CHANNEL_ID"
 
 DEFAULT_CONFIG = {
     "ADMIN_ROLE_ID": "000000000000000000",
@@ -23,30 +28,96 @@ DEFAULT_CONFIG = {
 
 logger = logging.getLogger('team_analysis_bot')
 
-TIME_TRACKING_CHANNEL_ID = int(os.getenv("TIME_TRACKING_CHANNEL_ID", "0"))
+TIME_TRACKING_CHANNEL_ID = int(os.getenv(_ENV_TIME_TRACKING_CHANNEL_ID, "0"))
+ADMIN_ROLE_ID = int(os.getenv("ADMIN_ROLE_ID") or "0")
+PO_ROLE_ID = int(os.getenv("PO_ROLE_ID") or "0")
+
+DISPATCH_MAX_CONCURRENT_INTERACTIONS = max(1, int(os.getenv("DISPATCH_MAX_CONCURRENT_INTERACTIONS", "4")))
+
+_rest_semaphore: Optional[asyncio.Semaphore] = None
 
 log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
 os.makedirs(log_dir, exist_ok=True)
 
+def queue_log_handlers(*handlers: logging.Handler) -> QueueHandler:
+    """
+    Cria um QueueHandler cujos registros são gravados pelos handlers informados em uma thread separada.
+
+    Assim o event loop só enfileira o registro e não espera pela escrita em arquivo ou console.
+    A thread de escrita é encerrada (esvaziando a fila) quando o processo termina.
+
+    Args:
+        *handlers: Handlers que efetivamente gravam os registros.
+
+    Returns:
+        QueueHandler: Handler a ser adicionado ao logger, com o QueueListener em `listener`.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.listener = listener
+    return queue_handler
+
+def clear_log_handlers(logger: logging.Logger):
+    """
+    Remove todos os handlers de um logger, encerrando as threads criadas por queue_log_handlers.
+
+    Apenas limpar logger.handlers deixaria a thread de escrita rodando com os arquivos abertos.
+
+    Args:
+        logger: Logger cujos handlers serão removidos.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        listener = getattr(handler, "listener", None)
+        if listener is not None:
+            atexit.unregister(listener.stop)
+            listener.stop()
+            for target in listener.handlers:
+                target.close()
+        handler.close()
+
+class BrazilTimeFormatter(logging.Formatter):
+    """
+    Formatter que gera o %(asctime)s no horário de Brasília, independente do fuso do servidor.
+
+    O horário vem de record.created, preenchido quando o registro é criado, então registros
+    descartados pelo nível do logger não pagam pela formatação da data.
+    """
+
+    def converter(self, timestamp: float):
+        return datetime.fromtimestamp(timestamp, BRAZIL_TIMEZONE).timetuple()
+
 def configure_logging():
-    """Configura o logging com handlers para arquivos e console."""
+    """
+    Configura o logging com handlers para arquivos e console.
+
+    Chamadas repetidas (por exemplo, ao recarregar o módulo) reaproveitam a configuração existente
+    em vez de registrar novos handlers, o que duplicaria cada registro nos arquivos.
+    """
     logger = logging.getLogger('team_analysis')
+    if logger.handlers:
+        return logger
+
     logger.setLevel(logging.DEBUG)
 
     cmd_logger = logging.getLogger('team_analysis_commands')
     cmd_logger.setLevel(logging.DEBUG)
 
-    file_handler = logging.FileHandler(os.path.join(log_dir, 'team_analysis.log'), encoding='utf-8')
+    file_formatter = BrazilTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    file_handler = logging.FileHandler(os.path.join(log_dir, 'team_analysis.log'), encoding='utf-8', delay=True)
     file_handler.setLevel(logging.INFO)
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(file_formatter)
 
-    debug_handler = logging.FileHandler(os.path.join(log_dir, 'debug.log'), encoding='utf-8')
+    debug_handler = logging.FileHandler(os.path.join(log_dir, 'debug.log'), encoding='utf-8', delay=True)
     debug_handler.setLevel(logging.DEBUG)
-    debug_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    debug_handler.setFormatter(debug_formatter)
+    debug_handler.setFormatter(file_formatter)
 
-    cmd_file_handler = logging.FileHandler(os.path.join(log_dir, 'commands.log'), encoding='utf-8')
+    cmd_file_handler = logging.FileHandler(os.path.join(log_dir, 'commands.log'), encoding='utf-8', delay=True)
     cmd_file_handler.setLevel(logging.INFO)
     cmd_file_handler.setFormatter(file_formatter)
 
@@ -55,13 +126,11 @@ def configure_logging():
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')
     console_handler.setFormatter(console_formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(debug_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(queue_log_handlers(file_handler, debug_handler, console_handler))
 
-    cmd_logger.addHandler(cmd_file_handler)
-    cmd_logger.addHandler(debug_handler)
-    cmd_logger.addHandler(console_handler)
+    # log_command repassa cada comando também para 'team_analysis', que já grava em debug.log e
+    # no console; aqui basta o arquivo próprio de comandos.
+    cmd_logger.addHandler(queue_log_handlers(cmd_file_handler))
 
     return logger
 
@@ -82,6 +151,21 @@ def get_env(key, default=None):
     return os.environ.get(key, default)
 
 
+def get_rest_semaphore() -> asyncio.Semaphore:
+    """
+    Retorna o semáforo compartilhado que limita os handlers que fazem muitas chamadas à API do Discord.
+
+    O limite é definido por DISPATCH_MAX_CONCURRENT_INTERACTIONS (padrão: 4).
+
+    Returns:
+        Semáforo compartilhado entre os handlers.
+    """
+    global _rest_semaphore
+    if _rest_semaphore is None:
+        _rest_semaphore = asyncio.Semaphore(DISPATCH_MAX_CONCURRENT_INTERACTIONS)
+    return _rest_semaphore
+
+
 def get_br_time() -> datetime:
     """
     Retorna a data e hora atual no fuso horário de Brasília.
@@ -119,29 +203,91 @@ def to_br_timezone(dt: datetime) -> datetime:
     return dt.astimezone(BRAZIL_TIMEZONE)
 
 
-def log_command(action: str, user: Union[discord.User, discord.Member], command: str, details: Optional[str] = None):
+if sys.version_info >= (3, 11):
+    parse_iso_datetime = datetime.fromisoformat
+else:
+    def parse_iso_datetime(value: str) -> datetime:
+        """
+        Converte uma string ISO 8601 em datetime, aceitando o sufixo 'Z' (UTC).
+        No Python 3.11+ datetime.fromisoformat já aceita o sufixo e é usado diretamente.
+
+        Args:
+            value (str): Data e hora no formato ISO 8601.
+
+        Returns:
+            datetime: Objeto datetime correspondente.
+        """
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+def log_command(action: str, user: Union[discord.User, discord.Member], command: str, details: Optional[str] = None,
+                *details_args: Any, command_args: tuple = ()):
     """
     Registra a execução de um comando por um usuário.
 
+    A mensagem só é montada se algum dos loggers estiver habilitado para INFO.
+
     Args:
         action (str): Tipo de ação (ex: "EXECUTADO", "ERRO", "REGISTRO")
         user (Union[discord.User, discord.Member]): Usuário que executou o comando
-        command (str): Nome do comando executado
-        details (Optional[str]): Detalhes adicionais sobre a execução
+        command (str): Nome do comando executado, podendo conter marcadores %s
+        details (Optional[str]): Detalhes adicionais sobre a execução, podendo conter marcadores %s
+        *details_args: Valores para os marcadores de details, formatados apenas quando o log é emitido
+        command_args (tuple): Valores para os marcadores de command, formatados apenas quando o log é emitido
     """
-    timestamp = get_br_time().strftime("%Y-%m-%d %H:%M:%S")
+    cmd_logger = logging.getLogger('team_analysis_commands')
+    log_to_commands = cmd_logger.isEnabledFor(logging.INFO)
+    log_to_main = logger.isEnabledFor(logging.INFO)
+    if not (log_to_commands or log_to_main):
+        return
 
-    user_info = f"@{user.name}#{user.discriminator} (ID: {user.id})"
+    if command_args:
+        command = command % command_args
+
+    if details_args:
+        details = details % details_args
+
+    discriminator = user.discriminator
+    if discriminator in ("", "0"):
+        user_info = f"@{user.name} (ID: {user.id})"
+    else:
+        user_info = f"@{user.name}#{discriminator} (ID: {user.id})"
 
     if details:
-        log_message = f"[{timestamp}] {action}: {user_info} executou {command} - {details}"
+        log_message = f"{action}: {user_info} executou {command} - {details}"
     else:
-        log_message = f"[{timestamp}] {action}: {user_info} executou {command}"
+        log_message = f"{action}: {user_info} executou {command}"
 
-    cmd_logger = logging.getLogger('team_analysis_commands')
-    cmd_logger.info(log_message)
+    if log_to_commands:
+        cmd_logger.info(log_message)
 
-    logger.info(f"COMANDO: {log_message}")
+    if log_to_main:
+        logger.info("COMANDO: %s", log_message)
+
+YMD_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+YMD_SLASH_DATE_PATTERN = re.compile(r'^(\d{4})/(\d{2})/(\d{2})$')
+DMY_DATE_PATTERN = re.compile(r'^(\d{2})/(\d{2})/(\d{4})$')
+
+def parse_ymd_date(date_string: str) -> Optional[date]:
+    """
+    Converte uma string no formato interno YYYY-MM-DD em um objeto date.
+
+    Args:
+        date_string: String de data no formato YYYY-MM-DD.
+
+    Returns:
+        Objeto date correspondente ou None se a string não estiver no formato ou a data for inválida.
+    """
+    match = YMD_DATE_PATTERN.match(date_string)
+    if not match:
+        return None
+
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        return None
 
 def parse_date_string(date_string: Optional[str]) -> Optional[str]:
     """
@@ -162,28 +308,19 @@ def parse_date_string(date_string: Optional[str]) -> Optional[str]:
 
     date_string = date_string.strip()
 
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', date_string):
-        try:
-            datetime.strptime(date_string, "%Y-%m-%d")
-            return date_string
-        except ValueError:
-            return None
-
-    if re.match(r'^\d{4}/\d{2}/\d{2}$', date_string):
-        try:
-            dt = datetime.strptime(date_string, "%Y/%m/%d")
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
-
-    if re.match(r'^\d{2}/\d{2}/\d{4}$', date_string):
-        try:
-            dt = datetime.strptime(date_string, "%d/%m/%Y")
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
+    match = YMD_DATE_PATTERN.match(date_string) or YMD_SLASH_DATE_PATTERN.match(date_string)
+    if match:
+        year, month, day = match[1], match[2], match[3]
+    else:
+        match = DMY_DATE_PATTERN.match(date_string)
+        if not match:
             return None
+        day, month, year = match[1], match[2], match[3]
 
-    return None
+    try:
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        return None
 
 def format_date_for_display(date_string: str) -> str:
     """
@@ -195,8 +332,8 @@ def format_date_for_display(date_string: str) -> str:
     Returns:
         Data formatada como DD/MM/YYYY.
     """
-    try:
-        dt = datetime.strptime(date_string, "%Y-%m-%d")
-        return dt.strftime("%d/%m/%Y")
-    except ValueError:
-        return date_string
\ No newline at end of file
+    date_obj = parse_ymd_date(date_string)
+    if date_obj is None:
+        return date_string
+
+    return f"{date_obj.day:02d}/{date_obj.month:02d}/{date_obj.year}"
\ No newline at end of file
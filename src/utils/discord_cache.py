@@ -0,0 +1,35 @@
+import time
+from typing import Dict, Tuple
+
+import discord
+
+USER_CACHE_TTL = 3600
+
+_user_cache: Dict[int, Tuple[float, discord.User]] = {}
+
+
+async def get_cached_user(client: discord.Client, user_id: int) -> discord.User:
+    """
+    Obtém um usuário do Discord, reutilizando o resultado por até USER_CACHE_TTL segundos.
+
+    Consulta primeiro o cache do cliente e só recorre à API do Discord quando necessário.
+
+    Args:
+        client: Cliente do Discord.
+        user_id: ID do usuário.
+
+    Returns:
+        O usuário encontrado.
+
+    Raises:
+        discord.NotFound: Se o usuário não existir.
+        discord.HTTPException: Se a consulta à API falhar.
+    """
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached and now - cached[0] < USER_CACHE_TTL:
+        return cached[1]
+
+    user = client.get_user(user_id) or await client.fetch_user(user_id)
+    _user_cache[user_id] = (now, user)
+    return user
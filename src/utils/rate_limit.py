@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import discord
+
+from src.utils.discord_cache import get_cached_user
+
+logger = logging.getLogger('team_analysis_bot')
+
+DM_RATE_LIMIT = 5
+DM_RATE_PERIOD = 5.0
+DEFAULT_RETRY_AFTER = 1.0
+DM_CONCURRENCY = 5
+
+
+class AsyncTokenBucket:
+    """
+    Limitador de taxa no formato token bucket para corrotinas.
+
+    Serve apenas para respeitar limites da API do Discord; para simplesmente ceder a vez
+    a outras tarefas do event loop, use `await asyncio.sleep(0)`.
+    """
+
+    def __init__(self, rate: int, per: float):
+        """
+        Args:
+            rate: Quantidade de tokens disponíveis por período (também é o tamanho da rajada).
+            per: Duração do período em segundos.
+        """
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Aguarda até que um token esteja disponível e o consome."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+_dm_bucket = AsyncTokenBucket(DM_RATE_LIMIT, DM_RATE_PERIOD)
+_dm_semaphore = asyncio.Semaphore(DM_CONCURRENCY)
+
+
+def _get_retry_after(error: discord.HTTPException) -> float:
+    """Extrai o tempo de espera do cabeçalho Retry-After de uma resposta 429."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+async def send_dm(user: discord.abc.User, **kwargs) -> Optional[discord.Message]:
+    """
+    Envia uma mensagem privada respeitando o limite de DMs do bot.
+
+    Se o Discord responder com 429, aguarda o tempo indicado em Retry-After e tenta novamente uma vez.
+
+    Args:
+        user: Usuário que receberá a mensagem.
+        **kwargs: Argumentos repassados para user.send.
+
+    Returns:
+        A mensagem enviada.
+
+    Raises:
+        discord.HTTPException: Se o envio falhar.
+    """
+    await _dm_bucket.acquire()
+    try:
+        return await user.send(**kwargs)
+    except discord.HTTPException as e:
+        if e.status != 429:
+            raise
+
+        retry_after = _get_retry_after(e)
+        logger.warning(f"Limite de envio de DMs atingido para o usuário {user.id}, tentando novamente em {retry_after:.1f}s")
+        await asyncio.sleep(retry_after)
+        await _dm_bucket.acquire()
+        return await user.send(**kwargs)
+
+
+async def send_reminder(client: discord.Client, user_id: int, embed: discord.Embed, kind: str) -> Optional[discord.User]:
+    """
+    Envia um lembrete por mensagem privada para um usuário.
+
+    O semáforo é compartilhado por todos os envios do bot, então lembretes agendados e cobranças
+    manuais simultâneos nunca passam de DM_CONCURRENCY DMs em andamento.
+
+    Args:
+        client: Cliente do Discord usado para obter o usuário.
+        user_id: ID numérico do usuário no Discord.
+        embed: Embed a ser enviado.
+        kind: Descrição do envio usada nos logs (ex.: "lembrete", "cobrança").
+
+    Returns:
+        O usuário que recebeu a mensagem ou None se o envio falhou.
+    """
+    async with _dm_semaphore:
+        try:
+            user = await get_cached_user(client, user_id)
+            await send_dm(user, embed=embed)
+            logger.info(f"Envio de {kind} concluído para o usuário {user_id}")
+            return user
+        except discord.HTTPException as e:
+            logger.error(f"Erro ao enviar {kind} para o usuário {user_id}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Erro inesperado ao processar {kind} para o usuário {user_id}: {str(e)}")
+    return None
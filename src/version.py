@@ -3,49 +3,67 @@ Informações de versão para o Team Analysis Bot.
 """
 import os
 import yaml
-import re
 import logging
+from functools import lru_cache
 
 __default_version__ = "0.0.0"
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 CHANGELOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'changelogs')
 
 logger = logging.getLogger('team_analysis_bot')
 
+def _is_semver(version: str) -> bool:
+    """Verifica se a string está no formato MAJOR.MINOR.PATCH, com as três partes numéricas."""
+    parts = version.split('.')
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+def _list_changelog_versions():
+    """
+    Lista as versões que possuem arquivo de changelog, ordenadas semanticamente (mais antiga para mais recente).
+
+    A chave de ordenação (tupla de inteiros) é calculada uma única vez por arquivo.
+
+    Returns:
+        list: Lista de strings com as versões encontradas.
+    """
+    with os.scandir(CHANGELOGS_DIR) as entries:
+        changelog_files = [entry.name for entry in entries
+                           if entry.name.endswith('.yaml') and _is_semver(entry.name[:-5]) and entry.is_file()]
+
+    logger.debug(f"Arquivos de changelog encontrados: {changelog_files}")
+
+    parsed = sorted((tuple(int(p) for p in f[:-5].split('.')), f[:-5]) for f in changelog_files)
+    return [version for _, version in parsed]
+
+@lru_cache(maxsize=1)
 def get_version():
     """
     Retorna a versão atual do bot.
 
     A versão é determinada dinamicamente examinando o arquivo de changelog mais recente.
     Se não for possível determinar a versão a partir dos changelogs, retorna a versão padrão.
+    Os changelogs fazem parte da imagem, então o resultado é calculado uma única vez por processo
+    (use get_version.cache_clear() para forçar uma nova leitura).
     """
     try:
         if not os.path.exists(CHANGELOGS_DIR):
             logger.warning(f"Diretório de changelogs não encontrado: {CHANGELOGS_DIR}")
             return __default_version__
 
-        changelog_files = [f for f in os.listdir(CHANGELOGS_DIR)
-                           if f.endswith('.yaml') and f != 'modelo.yaml' and re.match(r'^\d+\.\d+\.\d+$', f.split('.yaml')[0])]
+        versions = _list_changelog_versions()
 
-        logger.debug(f"Arquivos de changelog encontrados: {changelog_files}")
-
-        if not changelog_files:
+        if not versions:
             logger.warning("Nenhum arquivo de changelog encontrado")
             return __default_version__
 
-        changelog_files.sort(key=lambda x: [int(p) for p in x.split('.yaml')[0].split('.')], reverse=True)
-
-        latest_changelog = changelog_files[0]
-
-        version = latest_changelog.split('.yaml')[0]
-
-        if not re.match(r'^\d+\.\d+\.\d+$', version):
-            logger.warning(f"Formato de versão inválido: {version}")
-            return __default_version__
+        version = versions[-1]
+        latest_changelog = f"{version}.yaml"
 
         changelog_path = os.path.join(CHANGELOGS_DIR, latest_changelog)
         with open(changelog_path, 'r', encoding='utf-8') as f:
-            changelog_data = yaml.safe_load(f)
+            changelog_data = yaml.load(f, Loader=YAML_LOADER)
 
             if 'version' in changelog_data and changelog_data['version'] == version:
                 logger.debug(f"Versão determinada a partir do arquivo de changelog: {version}")
@@ -58,10 +76,14 @@ def get_version():
         logger.error(f"Erro ao determinar a versão: {str(e)}")
         return __default_version__
 
+@lru_cache(maxsize=1)
 def get_all_versions():
     """
     Retorna todas as versões disponíveis ordenadas semanticamente (mais antiga para mais recente).
 
+    O resultado é calculado uma única vez por processo e a mesma lista é devolvida a cada chamada,
+    portanto não deve ser modificada.
+
     Returns:
         list: Lista de strings com as versões disponíveis.
     """
@@ -70,18 +92,10 @@ def get_all_versions():
             logger.warning(f"Diretório de changelogs não encontrado: {CHANGELOGS_DIR}")
             return []
 
-        changelog_files = [f for f in os.listdir(CHANGELOGS_DIR)
-                          if f.endswith('.yaml') and f != 'modelo.yaml' and re.match(r'^\d+\.\d+\.\d+$', f.split('.yaml')[0])]
-
-        logger.debug(f"Arquivos de changelog encontrados: {changelog_files}")
+        versions = _list_changelog_versions()
 
-        if not changelog_files:
+        if not versions:
             logger.warning("Nenhum arquivo de changelog encontrado")
-            return []
-
-        changelog_files.sort(key=lambda x: [int(p) for p in x.split('.yaml')[0].split('.')])
-
-        versions = [f.split('.yaml')[0] for f in changelog_files]
 
         return versions
 